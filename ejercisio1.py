@@ -1,99 +1,1064 @@
+import math
+from array import array
+from itertools import accumulate, groupby, islice
+from operator import le
+
+# Índice que representa un hijo vacío en ArbolBinarioBusquedaCompacto
+_NULO = -1
+
 class Nodo:
     """Clase para representar un nodo en el árbol binario de búsqueda."""
     def __init__(self, valor):
         self.valor = valor
         self.izquierda = None
         self.derecha = None
+        # Ocurrencias del valor (mayor que 1 solo con compactar_duplicados)
+        self.cuenta = 1
+        # Altura y cantidad de valores (contando repeticiones) del subárbol
+        self.altura = 1
+        self.tamano = 1
 
 class ArbolBinarioBusqueda:
-    """Clase para representar un árbol binario de búsqueda."""
-    def __init__(self):
+    """
+    Clase para representar un árbol binario de búsqueda.
+    
+    Con autobalanceado=True el árbol se comporta como un árbol AVL: aplica
+    rotaciones al insertar y al eliminar para que la altura se mantenga en
+    O(log n) sin necesidad de llamar a balancear_arbol.
+    
+    Con alfa (entre 0.5 y 1) el árbol sigue la política de los árboles chivo
+    expiatorio: si una inserción deja un nodo a una profundidad mayor que
+    log_{1/alfa}(n), se reconstruye solo el subárbol más pequeño del camino
+    que incumple el balance por peso alfa, con O(log n) amortizado por
+    inserción y sin reconstrucciones globales.
+    
+    Con compactar_duplicados=True cada valor distinto ocupa un solo nodo con
+    un contador de ocurrencias: insertar un valor repetido solo incrementa el
+    contador. Los recorridos devuelven cada valor tantas veces como aparece.
+    """
+    def __init__(self, autobalanceado=False, alfa=None, compactar_duplicados=False):
+        if alfa is not None and not 0.5 < alfa < 1:
+            raise ValueError("alfa debe estar entre 0.5 y 1")
+        if alfa is not None and autobalanceado:
+            raise ValueError("alfa no se puede combinar con el modo autobalanceado")
+        
         self.raiz = None
+        self.autobalanceado = autobalanceado
+        self.alfa = alfa
+        self.compactar_duplicados = compactar_duplicados
+    
+    @classmethod
+    def desde_iterable(cls, valores, autobalanceado=False, alfa=None, compactar_duplicados=False):
+        """
+        Construye un árbol balanceado a partir de cualquier iterable en una pasada.
+        
+        Si los valores ya vienen ordenados la construcción es O(n); si no, se
+        ordenan primero en O(n log n).
+        
+        Args:
+            valores: Iterable (lista, generador, etc.) con los valores a cargar.
+            autobalanceado, alfa, compactar_duplicados: Modo del árbol
+                resultante (ver ArbolBinarioBusqueda).
+            
+        Returns:
+            Un nuevo ArbolBinarioBusqueda balanceado con todos los valores.
+        """
+        valores = list(valores)
+        if not all(map(le, valores, islice(valores, 1, None))):
+            valores.sort()
+        
+        arbol = cls(autobalanceado=autobalanceado, alfa=alfa, compactar_duplicados=compactar_duplicados)
+        cuentas = None
+        if compactar_duplicados:
+            # Agrupa los valores repetidos (ya consecutivos) en un solo nodo
+            grupos = [(valor, len(list(repetidos))) for valor, repetidos in groupby(valores)]
+            valores = [valor for valor, _ in grupos]
+            cuentas = [cuenta for _, cuenta in grupos]
+        
+        arbol.raiz = _construir_arbol_balanceado(valores, 0, len(valores) - 1, cuentas)
+        return arbol
     
     def insertar(self, valor):
         """Inserta un valor en el árbol."""
         if self.raiz is None:
             self.raiz = Nodo(valor)
+            return
+        
+        # Desciende desde la raíz guardando el camino recorrido
+        compactar = self.compactar_duplicados
+        camino = []
+        nodo = self.raiz
+        while nodo is not None:
+            if compactar and valor == nodo.valor:
+                # Valor repetido: solo cambian el contador y los tamaños
+                nodo.cuenta += 1
+                nodo.tamano += 1
+                for ancestro in camino:
+                    ancestro.tamano += 1
+                return
+            camino.append(nodo)
+            nodo = nodo.izquierda if valor < nodo.valor else nodo.derecha
+        
+        padre = camino[-1]
+        nuevo = Nodo(valor)
+        if valor < padre.valor:
+            padre.izquierda = nuevo
         else:
-            self._insertar_recursivo(self.raiz, valor)
+            padre.derecha = nuevo
+        
+        if self.autobalanceado:
+            self._rebalancear_camino(camino)
+            return
+        
+        # Sube por el camino contando la nueva hoja en cada ancestro y
+        # actualizando la altura mientras la hoja la haga crecer
+        altura = 1
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            nodo.tamano += 1
+            if altura and nodo.altura <= altura:
+                altura += 1
+                nodo.altura = altura
+            else:
+                altura = 0
+        
+        # La nueva hoja está a profundidad len(camino)
+        if self.alfa is not None and len(camino) > math.log(self.raiz.tamano, 1 / self.alfa):
+            self._reconstruir_chivo_expiatorio(camino, nuevo)
+    
+    def _reconstruir_chivo_expiatorio(self, camino, hoja):
+        """
+        Reconstruye balanceado el subárbol más bajo del camino que no cumple el
+        balance por peso alfa (el "chivo expiatorio").
+        
+        Args:
+            camino: Ancestros, desde la raíz, de la hoja recién insertada.
+            hoja: La hoja recién insertada.
+        """
+        hijo = hoja
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            if hijo.tamano > self.alfa * nodo.tamano:
+                nodos = self._nodos_inorden(nodo)
+                valores = [n.valor for n in nodos]
+                cuentas = [n.cuenta for n in nodos] if self.compactar_duplicados else None
+                nuevo = _construir_arbol_balanceado(valores, 0, len(valores) - 1, cuentas)
+                self._reemplazar_hijo(camino[i - 1] if i > 0 else None, nodo, nuevo)
+                
+                # Los tamaños no cambian, pero la altura de los ancestros puede bajar
+                self._actualizar_camino(camino[:i])
+                return
+            hijo = nodo
     
-    def _insertar_recursivo(self, nodo, valor):
-        """Función auxiliar recursiva para insertar un valor."""
-        if valor < nodo.valor:
-            if nodo.izquierda is None:
-                nodo.izquierda = Nodo(valor)
+    def eliminar(self, valor):
+        """
+        Elimina una ocurrencia del valor en el árbol.
+        
+        Returns:
+            True si el valor estaba en el árbol, False en caso contrario.
+        """
+        # Busca el nodo guardando el camino de ancestros
+        camino = []
+        nodo = self.raiz
+        while nodo is not None:
+            if valor < nodo.valor:
+                camino.append(nodo)
+                nodo = nodo.izquierda
+            elif valor > nodo.valor:
+                camino.append(nodo)
+                nodo = nodo.derecha
             else:
-                self._insertar_recursivo(nodo.izquierda, valor)
+                break
+        
+        if nodo is None:
+            return False
+        
+        if nodo.cuenta > 1:
+            # Valor repetido: basta con descontar una ocurrencia
+            nodo.cuenta -= 1
+            nodo.tamano -= 1
+            for ancestro in camino:
+                ancestro.tamano -= 1
+            return True
+        
+        padre = camino[-1] if camino else None
+        
+        if nodo.izquierda is None or nodo.derecha is None:
+            # Con a lo sumo un hijo, el hijo ocupa el lugar del nodo
+            reemplazo = nodo.izquierda if nodo.izquierda is not None else nodo.derecha
+        else:
+            # Con dos hijos, el sucesor inorden ocupa el lugar del nodo
+            camino_sucesor = []
+            sucesor = nodo.derecha
+            while sucesor.izquierda is not None:
+                camino_sucesor.append(sucesor)
+                sucesor = sucesor.izquierda
+            
+            if camino_sucesor:
+                camino_sucesor[-1].izquierda = sucesor.derecha
+                sucesor.derecha = nodo.derecha
+            sucesor.izquierda = nodo.izquierda
+            
+            reemplazo = sucesor
+            camino.append(sucesor)
+            camino.extend(camino_sucesor)
+        
+        self._reemplazar_hijo(padre, nodo, reemplazo)
+        
+        if self.autobalanceado:
+            self._rebalancear_camino(camino)
         else:
-            if nodo.derecha is None:
-                nodo.derecha = Nodo(valor)
+            self._actualizar_camino(camino)
+        return True
+    
+    def _reemplazar_hijo(self, padre, hijo, nuevo):
+        """Sustituye el enlace de padre hacia hijo por un enlace hacia nuevo."""
+        if padre is None:
+            self.raiz = nuevo
+        elif padre.izquierda is hijo:
+            padre.izquierda = nuevo
+        else:
+            padre.derecha = nuevo
+    
+    def _actualizar_camino(self, camino):
+        """Recalcula, de abajo hacia arriba, los datos de los nodos de un camino desde la raíz."""
+        for i in range(len(camino) - 1, -1, -1):
+            self._actualizar_nodo(camino[i])
+    
+    def _rebalancear_camino(self, camino):
+        """
+        Rebalancea, de abajo hacia arriba, los nodos de un camino desde la raíz.
+        
+        Args:
+            camino: Lista de nodos donde cada uno es hijo del anterior.
+        """
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            nueva_raiz = self._rebalancear(nodo)
+            if nueva_raiz is not nodo:
+                self._reemplazar_hijo(camino[i - 1] if i > 0 else None, nodo, nueva_raiz)
+    
+    @staticmethod
+    def _altura_nodo(nodo):
+        """Devuelve la altura almacenada de un nodo (0 para un subárbol vacío)."""
+        return nodo.altura if nodo is not None else 0
+    
+    @staticmethod
+    def _tamano_nodo(nodo):
+        """Devuelve la cantidad de nodos de un subárbol (0 si está vacío)."""
+        return nodo.tamano if nodo is not None else 0
+    
+    def _actualizar_nodo(self, nodo):
+        """Recalcula la altura y el tamaño almacenados de un nodo a partir de sus hijos."""
+        nodo.altura = max(self._altura_nodo(nodo.izquierda), self._altura_nodo(nodo.derecha)) + 1
+        nodo.tamano = self._tamano_nodo(nodo.izquierda) + self._tamano_nodo(nodo.derecha) + nodo.cuenta
+    
+    def _rotar_derecha(self, nodo):
+        """Rota el subárbol a la derecha y devuelve su nueva raíz."""
+        nueva_raiz = nodo.izquierda
+        nodo.izquierda = nueva_raiz.derecha
+        nueva_raiz.derecha = nodo
+        
+        self._actualizar_nodo(nodo)
+        self._actualizar_nodo(nueva_raiz)
+        return nueva_raiz
+    
+    def _rotar_izquierda(self, nodo):
+        """Rota el subárbol a la izquierda y devuelve su nueva raíz."""
+        nueva_raiz = nodo.derecha
+        nodo.derecha = nueva_raiz.izquierda
+        nueva_raiz.izquierda = nodo
+        
+        self._actualizar_nodo(nodo)
+        self._actualizar_nodo(nueva_raiz)
+        return nueva_raiz
+    
+    def _rebalancear(self, nodo):
+        """
+        Actualiza la altura de un nodo y aplica las rotaciones AVL necesarias.
+        
+        Returns:
+            La nueva raíz del subárbol.
+        """
+        self._actualizar_nodo(nodo)
+        factor = self._altura_nodo(nodo.izquierda) - self._altura_nodo(nodo.derecha)
+        
+        # Subárbol izquierdo demasiado alto: caso izquierda-izquierda o izquierda-derecha
+        if factor > 1:
+            if self._altura_nodo(nodo.izquierda.izquierda) < self._altura_nodo(nodo.izquierda.derecha):
+                nodo.izquierda = self._rotar_izquierda(nodo.izquierda)
+            return self._rotar_derecha(nodo)
+        
+        # Subárbol derecho demasiado alto: caso derecha-derecha o derecha-izquierda
+        if factor < -1:
+            if self._altura_nodo(nodo.derecha.derecha) < self._altura_nodo(nodo.derecha.izquierda):
+                nodo.derecha = self._rotar_derecha(nodo.derecha)
+            return self._rotar_izquierda(nodo)
+        
+        return nodo
+    
+    def balancear(self):
+        """
+        Balancea el árbol en el lugar reutilizando sus nodos (algoritmo Day-Stout-Warren).
+        
+        Primero convierte el árbol en una "enredadera" (una lista enlazada por la
+        derecha) mediante rotaciones a la derecha, y después la comprime con
+        rotaciones a la izquierda hasta obtener un árbol completo. No crea nodos
+        ni listas intermedias: solo usa memoria auxiliar constante, más una pila
+        de O(log n) para recalcular las alturas y tamaños al final.
+        """
+        # Pseudo-raíz que cuelga el árbol de su hijo derecho y simplifica las rotaciones
+        seudo_raiz = Nodo(None)
+        seudo_raiz.derecha = self.raiz
+        
+        # Paso 1: Árbol a enredadera
+        cantidad = 0
+        cola = seudo_raiz
+        resto = cola.derecha
+        while resto is not None:
+            if resto.izquierda is None:
+                cola = resto
+                resto = resto.derecha
+                cantidad += 1
+            else:
+                # Rotación a la derecha sobre resto
+                hijo = resto.izquierda
+                resto.izquierda = hijo.derecha
+                hijo.derecha = resto
+                resto = hijo
+                cola.derecha = hijo
+        
+        # Paso 2: Enredadera a árbol. La primera compresión deja en la enredadera
+        # 2^k - 1 nodos; el resto de pasadas la reparten en un árbol completo.
+        completos = (1 << ((cantidad + 1).bit_length() - 1)) - 1
+        self._comprimir(seudo_raiz, cantidad - completos)
+        while completos > 1:
+            completos //= 2
+            self._comprimir(seudo_raiz, completos)
+        
+        self.raiz = seudo_raiz.derecha
+        self._recalcular_subarbol(self.raiz)
+    
+    @staticmethod
+    def _comprimir(seudo_raiz, rotaciones):
+        """Aplica una pasada de rotaciones a la izquierda sobre la enredadera."""
+        escaner = seudo_raiz
+        for _ in range(rotaciones):
+            hijo = escaner.derecha
+            escaner.derecha = hijo.derecha
+            escaner = escaner.derecha
+            hijo.derecha = escaner.izquierda
+            escaner.izquierda = hijo
+    
+    def _recalcular_subarbol(self, raiz):
+        """Recalcula en postorden la altura y el tamaño almacenados de un subárbol."""
+        pila = []
+        nodo = raiz
+        ultimo = None
+        while pila or nodo is not None:
+            if nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierda
             else:
-                self._insertar_recursivo(nodo.derecha, valor)
+                cima = pila[-1]
+                if cima.derecha is not None and cima.derecha is not ultimo:
+                    nodo = cima.derecha
+                else:
+                    self._actualizar_nodo(cima)
+                    ultimo = pila.pop()
     
     def recorrido_inorden(self):
         """Realiza un recorrido inorden del árbol y devuelve una lista de valores."""
+        return self._valores_inorden(self.raiz)
+    
+    @staticmethod
+    def _valores_inorden(nodo):
+        """Devuelve en una lista los valores del subárbol de nodo, en inorden."""
         resultado = []
-        self._recorrido_inorden_recursivo(self.raiz, resultado)
+        pila = []
+        apilar, desapilar, agregar = pila.append, pila.pop, resultado.append
+        
+        while pila or nodo is not None:
+            # Baja por la rama izquierda apilando los nodos pendientes
+            while nodo is not None:
+                apilar(nodo)
+                nodo = nodo.izquierda
+            
+            nodo = desapilar()
+            if nodo.cuenta == 1:
+                agregar(nodo.valor)
+            else:
+                resultado.extend([nodo.valor] * nodo.cuenta)
+            nodo = nodo.derecha
+        
         return resultado
     
-    def _recorrido_inorden_recursivo(self, nodo, resultado):
-        """Función auxiliar recursiva para el recorrido inorden."""
-        if nodo:
-            self._recorrido_inorden_recursivo(nodo.izquierda, resultado)
-            resultado.append(nodo.valor)
-            self._recorrido_inorden_recursivo(nodo.derecha, resultado)
+    @staticmethod
+    def _nodos_inorden(nodo):
+        """Devuelve en una lista los nodos del subárbol de nodo, en inorden."""
+        resultado = []
+        pila = []
+        apilar, desapilar, agregar = pila.append, pila.pop, resultado.append
+        
+        while pila or nodo is not None:
+            # Baja por la rama izquierda apilando los nodos pendientes
+            while nodo is not None:
+                apilar(nodo)
+                nodo = nodo.izquierda
+            
+            nodo = desapilar()
+            agregar(nodo)
+            nodo = nodo.derecha
+        
+        return resultado
     
-    def altura(self):
-        """Calcula la altura del árbol."""
-        return self._altura_recursiva(self.raiz)
+    def iterar_inorden(self):
+        """
+        Genera los valores del árbol en inorden de forma perezosa.
+        
+        Usa memoria O(altura) y permite detener el recorrido en cualquier momento.
+        """
+        pila = []
+        nodo = self.raiz
+        
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierda
+            
+            nodo = pila.pop()
+            for _ in range(nodo.cuenta):
+                yield nodo.valor
+            nodo = nodo.derecha
     
-    def _altura_recursiva(self, nodo):
-        """Función auxiliar recursiva para calcular la altura."""
-        if nodo is None:
-            return 0
+    def __iter__(self):
+        """Permite recorrer el árbol en inorden con un for."""
+        return self.iterar_inorden()
+    
+    def iterar_rango(self, inferior, superior):
+        """
+        Genera en orden los valores v del árbol con inferior <= v < superior.
+        
+        Los subárboles que quedan fuera del rango no se visitan, por lo que el
+        recorrido cuesta O(altura + k) para k valores devueltos.
+        
+        Args:
+            inferior: Límite inferior del rango (incluido).
+            superior: Límite superior del rango (excluido).
+        """
+        pila = []
+        nodo = self.raiz
+        
+        while True:
+            # Baja hacia la izquierda saltando los nodos menores que el límite
+            # inferior (su subárbol izquierdo también queda fuera del rango)
+            while nodo is not None:
+                if nodo.valor < inferior:
+                    nodo = nodo.derecha
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.izquierda
+            
+            if not pila:
+                return
+            
+            nodo = pila.pop()
+            if not nodo.valor < superior:
+                return
+            for _ in range(nodo.cuenta):
+                yield nodo.valor
+            nodo = nodo.derecha
+    
+    def __len__(self):
+        """Devuelve la cantidad de valores del árbol en O(1)."""
+        return self._tamano_nodo(self.raiz)
+    
+    def k_esimo(self, k):
+        """
+        Devuelve el k-ésimo menor valor del árbol en O(altura).
+        
+        Args:
+            k: Posición buscada, empezando en 1 para el mínimo.
+            
+        Returns:
+            El valor que ocupa la posición k en el recorrido inorden.
+        """
+        if not 1 <= k <= len(self):
+            raise IndexError(f"k debe estar entre 1 y {len(self)}")
+        
+        nodo = self.raiz
+        while True:
+            tamano_izquierda = self._tamano_nodo(nodo.izquierda)
+            if k <= tamano_izquierda:
+                nodo = nodo.izquierda
+            elif k <= tamano_izquierda + nodo.cuenta:
+                return nodo.valor
+            else:
+                k -= tamano_izquierda + nodo.cuenta
+                nodo = nodo.derecha
+    
+    def rango(self, valor):
+        """Devuelve en O(altura) cuántos valores del árbol son menores que valor."""
+        cantidad = 0
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.valor < valor:
+                # El nodo y todo su subárbol izquierdo son menores que valor
+                cantidad += self._tamano_nodo(nodo.izquierda) + nodo.cuenta
+                nodo = nodo.derecha
+            else:
+                nodo = nodo.izquierda
+        return cantidad
+    
+    def contar_entre(self, inferior, superior):
+        """Cuenta en O(altura) los valores v con inferior <= v < superior."""
+        return max(0, self.rango(superior) - self.rango(inferior))
+    
+    def piso(self, valor):
+        """Devuelve en O(altura) el mayor valor <= valor, o None si no hay ninguno."""
+        return self._anterior(valor, incluir_igual=True)
+    
+    def techo(self, valor):
+        """Devuelve en O(altura) el menor valor >= valor, o None si no hay ninguno."""
+        return self._siguiente(valor, incluir_igual=True)
+    
+    def predecesor(self, valor):
+        """Devuelve en O(altura) el mayor valor < valor, o None si no hay ninguno."""
+        return self._anterior(valor, incluir_igual=False)
+    
+    def sucesor(self, valor):
+        """Devuelve en O(altura) el menor valor > valor, o None si no hay ninguno."""
+        return self._siguiente(valor, incluir_igual=False)
+    
+    def _anterior(self, valor, incluir_igual):
+        """Devuelve el mayor valor menor que valor (o igual, si incluir_igual) en O(altura), o None."""
+        resultado = None
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.valor < valor or (incluir_igual and nodo.valor == valor):
+                # Candidato; uno mayor solo puede estar a la derecha
+                resultado = nodo.valor
+                nodo = nodo.derecha
+            else:
+                nodo = nodo.izquierda
+        return resultado
+    
+    def _siguiente(self, valor, incluir_igual):
+        """Devuelve el menor valor mayor que valor (o igual, si incluir_igual) en O(altura), o None."""
+        resultado = None
+        nodo = self.raiz
+        while nodo is not None:
+            if valor < nodo.valor or (incluir_igual and nodo.valor == valor):
+                # Candidato; uno menor solo puede estar a la izquierda
+                resultado = nodo.valor
+                nodo = nodo.izquierda
+            else:
+                nodo = nodo.derecha
+        return resultado
+    
+    def ancestro_comun(self, p, q):
+        """
+        Encuentra el ancestro común más cercano de dos valores en O(altura).
         
-        altura_izquierda = self._altura_recursiva(nodo.izquierda)
-        altura_derecha = self._altura_recursiva(nodo.derecha)
+        Desciende desde la raíz mientras p y q queden del mismo lado del nodo;
+        el primer nodo que los separa (o que es igual a uno de ellos) es el
+        ancestro común. No visita ningún nodo fuera de ese camino.
         
-        return max(altura_izquierda, altura_derecha) + 1
+        Args:
+            p: El valor del primer nodo.
+            q: El valor del segundo nodo.
+            
+        Returns:
+            El valor del ancestro común más cercano, o None si alguno de los
+            valores no está en el árbol.
+        """
+        if q < p:
+            p, q = q, p
+        
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.valor < p:
+                nodo = nodo.derecha
+            elif q < nodo.valor:
+                nodo = nodo.izquierda
+            else:
+                break
+        
+        if nodo is None or not (self._contiene_desde(nodo, p) and self._contiene_desde(nodo, q)):
+            return None
+        return nodo.valor
+    
+    @staticmethod
+    def _contiene_desde(nodo, valor):
+        """Busca un valor en el subárbol de nodo en O(altura)."""
+        while nodo is not None:
+            if valor == nodo.valor:
+                return True
+            nodo = nodo.izquierda if valor < nodo.valor else nodo.derecha
+        return False
+    
+    def altura(self):
+        """Devuelve la altura del árbol, almacenada en la raíz."""
+        return self._altura_nodo(self.raiz)
     
     def esta_balanceado(self):
         """Verifica si el árbol está balanceado."""
-        return self._esta_balanceado_recursivo(self.raiz)
-    
-    def _esta_balanceado_recursivo(self, nodo):
-        """Función auxiliar recursiva para verificar si el árbol está balanceado."""
-        if nodo is None:
+        # En modo autobalanceado las rotaciones AVL garantizan el balance
+        if self.autobalanceado:
             return True
         
-        altura_izquierda = self._altura_recursiva(nodo.izquierda)
-        altura_derecha = self._altura_recursiva(nodo.derecha)
-        
         # Un árbol está balanceado si la diferencia de altura entre los subárboles
-        # izquierdo y derecho no es mayor que 1, y ambos subárboles están balanceados
-        if abs(altura_izquierda - altura_derecha) <= 1 and \
-           self._esta_balanceado_recursivo(nodo.izquierda) and \
-           self._esta_balanceado_recursivo(nodo.derecha):
-            return True
+        # izquierdo y derecho no es mayor que 1, y ambos subárboles están balanceados.
+        # Con las alturas almacenadas basta con visitar cada nodo una vez.
+        pila = [self.raiz] if self.raiz is not None else []
+        while pila:
+            nodo = pila.pop()
+            izquierda, derecha = nodo.izquierda, nodo.derecha
+            altura_izquierda = izquierda.altura if izquierda is not None else 0
+            altura_derecha = derecha.altura if derecha is not None else 0
+            
+            if abs(altura_izquierda - altura_derecha) > 1:
+                return False
+            
+            if izquierda is not None:
+                pila.append(izquierda)
+            if derecha is not None:
+                pila.append(derecha)
         
-        return False
+        return True
     
     def imprimir_estructura(self):
         """Imprime la estructura del árbol en forma visual."""
-        self._imprimir_estructura_recursivo(self.raiz, "", True)
-    
-    def _imprimir_estructura_recursivo(self, nodo, prefijo, es_ultimo):
-        """Función auxiliar recursiva para imprimir la estructura del árbol."""
-        if nodo is not None:
+        pila = [(self.raiz, "", True)]
+        
+        while pila:
+            nodo, prefijo, es_ultimo = pila.pop()
+            if nodo is None:
+                continue
+            
             print(prefijo + ("└── " if es_ultimo else "├── ") + str(nodo.valor))
             
             # Prepara el prefijo para los hijos
             nuevo_prefijo = prefijo + ("    " if es_ultimo else "│   ")
             
-            # Imprime el hijo derecho primero, luego el izquierdo
-            if nodo.derecha or nodo.izquierda:
-                self._imprimir_estructura_recursivo(nodo.derecha, nuevo_prefijo, nodo.izquierda is None)
-                self._imprimir_estructura_recursivo(nodo.izquierda, nuevo_prefijo, True)
+            # Imprime el hijo derecho primero, luego el izquierdo (la pila invierte el orden)
+            pila.append((nodo.izquierda, nuevo_prefijo, True))
+            pila.append((nodo.derecha, nuevo_prefijo, nodo.izquierda is None))
+
+
+class ArbolBinarioBusquedaCompacto:
+    """
+    Árbol binario de búsqueda con los nodos guardados en arreglos tipados paralelos.
+    
+    En lugar de un objeto Nodo por valor, el nodo i está formado por
+    valores[i], izquierdas[i], derechas[i], alturas[i] y tamanos[i]; los hijos
+    se referencian por índice y _NULO marca un hijo vacío. Con claves enteras
+    cada nodo ocupa 24 bytes, varias veces menos que un Nodo, y los recorridos
+    leen memoria contigua. Ofrece la misma API que ArbolBinarioBusqueda salvo
+    el modo autobalanceado.
+    """
+    def __init__(self, tipo="q"):
+        """
+        Args:
+            tipo: Código de tipo del módulo array para los valores ("q" para
+                enteros de 64 bits, "d" para flotantes, etc.).
+        """
+        self.raiz = _NULO
+        self.valores = array(tipo)
+        self.izquierdas = array("i")
+        self.derechas = array("i")
+        self.alturas = array("i")
+        self.tamanos = array("i")
+        # Índices de nodos eliminados que se reutilizan en las siguientes inserciones
+        self._libres = array("i")
+    
+    @classmethod
+    def desde_iterable(cls, valores, tipo="q"):
+        """
+        Construye un árbol balanceado a partir de cualquier iterable en una pasada.
+        
+        Los valores se guardan ordenados, de modo que el nodo i contiene el
+        i-ésimo menor valor y solo hace falta calcular los enlaces entre nodos
+        con la misma estrategia del medio que _construir_arbol_balanceado.
+        
+        Args:
+            valores: Iterable (lista, generador, etc.) con los valores a cargar.
+            tipo: Código de tipo del módulo array para los valores.
+            
+        Returns:
+            Un nuevo ArbolBinarioBusquedaCompacto balanceado con todos los valores.
+        """
+        arbol = cls(tipo)
+        arbol._cargar_ordenados(array(tipo, valores))
+        return arbol
+    
+    def _cargar_ordenados(self, valores):
+        """Reemplaza el contenido del árbol por un árbol balanceado de los valores dados."""
+        if not all(map(le, valores, islice(valores, 1, None))):
+            valores = array(valores.typecode, sorted(valores))
+        
+        cantidad = len(valores)
+        self.valores = valores
+        self.izquierdas = array("i", [_NULO]) * cantidad
+        self.derechas = array("i", [_NULO]) * cantidad
+        self.alturas = array("i", [0]) * cantidad
+        self.tamanos = array("i", [0]) * cantidad
+        self._libres = array("i")
+        self.raiz = _NULO
+        if not cantidad:
+            return
+        
+        izquierdas, derechas = self.izquierdas, self.derechas
+        alturas, tamanos = self.alturas, self.tamanos
+        
+        # Cada entrada de la pila es el rango [inicio, fin] de un subárbol; su
+        # raíz es el índice del medio y su altura el bit_length de su tamaño
+        self.raiz = (cantidad - 1) // 2
+        pila = [(0, cantidad - 1)]
+        while pila:
+            inicio, fin = pila.pop()
+            medio = (inicio + fin) // 2
+            tamanos[medio] = fin - inicio + 1
+            alturas[medio] = tamanos[medio].bit_length()
+            
+            if inicio < medio:
+                izquierdas[medio] = (inicio + medio - 1) // 2
+                pila.append((inicio, medio - 1))
+            if medio < fin:
+                derechas[medio] = (medio + 1 + fin) // 2
+                pila.append((medio + 1, fin))
+    
+    def _nuevo_nodo(self, valor):
+        """Reserva un nodo hoja para el valor y devuelve su índice."""
+        if self._libres:
+            indice = self._libres.pop()
+            self.valores[indice] = valor
+            self.izquierdas[indice] = _NULO
+            self.derechas[indice] = _NULO
+            self.alturas[indice] = 1
+            self.tamanos[indice] = 1
+            return indice
+        
+        self.valores.append(valor)
+        self.izquierdas.append(_NULO)
+        self.derechas.append(_NULO)
+        self.alturas.append(1)
+        self.tamanos.append(1)
+        return len(self.valores) - 1
+    
+    def insertar(self, valor):
+        """Inserta un valor en el árbol."""
+        nuevo = self._nuevo_nodo(valor)
+        if self.raiz == _NULO:
+            self.raiz = nuevo
+            return
+        
+        valores, izquierdas, derechas = self.valores, self.izquierdas, self.derechas
+        alturas, tamanos = self.alturas, self.tamanos
+        
+        # Desciende desde la raíz guardando el camino recorrido
+        camino = []
+        nodo = self.raiz
+        while nodo != _NULO:
+            camino.append(nodo)
+            nodo = izquierdas[nodo] if valor < valores[nodo] else derechas[nodo]
+        
+        padre = camino[-1]
+        if valor < valores[padre]:
+            izquierdas[padre] = nuevo
+        else:
+            derechas[padre] = nuevo
+        
+        # Sube por el camino contando la nueva hoja en cada ancestro y
+        # actualizando la altura mientras la hoja la haga crecer
+        altura = 1
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            tamanos[nodo] += 1
+            if altura and alturas[nodo] <= altura:
+                altura += 1
+                alturas[nodo] = altura
+            else:
+                altura = 0
+    
+    def eliminar(self, valor):
+        """
+        Elimina una ocurrencia del valor en el árbol.
+        
+        Returns:
+            True si el valor estaba en el árbol, False en caso contrario.
+        """
+        valores, izquierdas, derechas = self.valores, self.izquierdas, self.derechas
+        
+        # Busca el nodo guardando el camino de ancestros
+        camino = []
+        nodo = self.raiz
+        while nodo != _NULO:
+            if valor < valores[nodo]:
+                camino.append(nodo)
+                nodo = izquierdas[nodo]
+            elif valor > valores[nodo]:
+                camino.append(nodo)
+                nodo = derechas[nodo]
+            else:
+                break
+        
+        if nodo == _NULO:
+            return False
+        
+        padre = camino[-1] if camino else _NULO
+        
+        if izquierdas[nodo] == _NULO or derechas[nodo] == _NULO:
+            # Con a lo sumo un hijo, el hijo ocupa el lugar del nodo
+            reemplazo = izquierdas[nodo] if izquierdas[nodo] != _NULO else derechas[nodo]
+        else:
+            # Con dos hijos, el sucesor inorden ocupa el lugar del nodo
+            camino_sucesor = []
+            sucesor = derechas[nodo]
+            while izquierdas[sucesor] != _NULO:
+                camino_sucesor.append(sucesor)
+                sucesor = izquierdas[sucesor]
+            
+            if camino_sucesor:
+                izquierdas[camino_sucesor[-1]] = derechas[sucesor]
+                derechas[sucesor] = derechas[nodo]
+            izquierdas[sucesor] = izquierdas[nodo]
+            
+            reemplazo = sucesor
+            camino.append(sucesor)
+            camino.extend(camino_sucesor)
+        
+        if padre == _NULO:
+            self.raiz = reemplazo
+        elif izquierdas[padre] == nodo:
+            izquierdas[padre] = reemplazo
+        else:
+            derechas[padre] = reemplazo
+        self._libres.append(nodo)
+        
+        # Recalcula, de abajo hacia arriba, la altura y el tamaño del camino
+        alturas, tamanos = self.alturas, self.tamanos
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            izquierda, derecha = izquierdas[nodo], derechas[nodo]
+            altura_izquierda = alturas[izquierda] if izquierda != _NULO else 0
+            altura_derecha = alturas[derecha] if derecha != _NULO else 0
+            alturas[nodo] = max(altura_izquierda, altura_derecha) + 1
+            tamanos[nodo] = ((tamanos[izquierda] if izquierda != _NULO else 0) +
+                             (tamanos[derecha] if derecha != _NULO else 0) + 1)
+        return True
+    
+    def balancear(self):
+        """Reconstruye el árbol balanceado, compactando los huecos de nodos eliminados."""
+        self._cargar_ordenados(array(self.valores.typecode, self.iterar_inorden()))
+    
+    def recorrido_inorden(self):
+        """Realiza un recorrido inorden del árbol y devuelve una lista de valores."""
+        return list(self.iterar_inorden())
+    
+    def iterar_inorden(self):
+        """
+        Genera los valores del árbol en inorden de forma perezosa.
+        
+        Usa memoria O(altura) y permite detener el recorrido en cualquier momento.
+        """
+        valores, izquierdas, derechas = self.valores, self.izquierdas, self.derechas
+        pila = []
+        nodo = self.raiz
+        
+        while pila or nodo != _NULO:
+            while nodo != _NULO:
+                pila.append(nodo)
+                nodo = izquierdas[nodo]
+            
+            nodo = pila.pop()
+            yield valores[nodo]
+            nodo = derechas[nodo]
+    
+    def __iter__(self):
+        """Permite recorrer el árbol en inorden con un for."""
+        return self.iterar_inorden()
+    
+    def iterar_rango(self, inferior, superior):
+        """
+        Genera en orden los valores v del árbol con inferior <= v < superior.
+        
+        Los subárboles que quedan fuera del rango no se visitan, por lo que el
+        recorrido cuesta O(altura + k) para k valores devueltos.
+        """
+        valores, izquierdas, derechas = self.valores, self.izquierdas, self.derechas
+        pila = []
+        nodo = self.raiz
+        
+        while True:
+            while nodo != _NULO:
+                if valores[nodo] < inferior:
+                    nodo = derechas[nodo]
+                else:
+                    pila.append(nodo)
+                    nodo = izquierdas[nodo]
+            
+            if not pila:
+                return
+            
+            nodo = pila.pop()
+            if not valores[nodo] < superior:
+                return
+            yield valores[nodo]
+            nodo = derechas[nodo]
+    
+    def __len__(self):
+        """Devuelve la cantidad de valores del árbol en O(1)."""
+        return self.tamanos[self.raiz] if self.raiz != _NULO else 0
+    
+    def k_esimo(self, k):
+        """Devuelve el k-ésimo menor valor del árbol (k empieza en 1) en O(altura)."""
+        if not 1 <= k <= len(self):
+            raise IndexError(f"k debe estar entre 1 y {len(self)}")
+        
+        izquierdas, derechas, tamanos = self.izquierdas, self.derechas, self.tamanos
+        nodo = self.raiz
+        while True:
+            izquierda = izquierdas[nodo]
+            tamano_izquierda = tamanos[izquierda] if izquierda != _NULO else 0
+            if k <= tamano_izquierda:
+                nodo = izquierda
+            elif k == tamano_izquierda + 1:
+                return self.valores[nodo]
+            else:
+                k -= tamano_izquierda + 1
+                nodo = derechas[nodo]
+    
+    def rango(self, valor):
+        """Devuelve en O(altura) cuántos valores del árbol son menores que valor."""
+        valores, izquierdas, derechas, tamanos = self.valores, self.izquierdas, self.derechas, self.tamanos
+        cantidad = 0
+        nodo = self.raiz
+        while nodo != _NULO:
+            if valores[nodo] < valor:
+                izquierda = izquierdas[nodo]
+                cantidad += (tamanos[izquierda] if izquierda != _NULO else 0) + 1
+                nodo = derechas[nodo]
+            else:
+                nodo = izquierdas[nodo]
+        return cantidad
+    
+    def contar_entre(self, inferior, superior):
+        """Cuenta en O(altura) los valores v con inferior <= v < superior."""
+        return max(0, self.rango(superior) - self.rango(inferior))
+    
+    def piso(self, valor):
+        """Devuelve en O(altura) el mayor valor <= valor, o None si no hay ninguno."""
+        return self._anterior(valor, incluir_igual=True)
+    
+    def techo(self, valor):
+        """Devuelve en O(altura) el menor valor >= valor, o None si no hay ninguno."""
+        return self._siguiente(valor, incluir_igual=True)
+    
+    def predecesor(self, valor):
+        """Devuelve en O(altura) el mayor valor < valor, o None si no hay ninguno."""
+        return self._anterior(valor, incluir_igual=False)
+    
+    def sucesor(self, valor):
+        """Devuelve en O(altura) el menor valor > valor, o None si no hay ninguno."""
+        return self._siguiente(valor, incluir_igual=False)
+    
+    def _anterior(self, valor, incluir_igual):
+        """Devuelve el mayor valor menor que valor (o igual, si incluir_igual) en O(altura), o None."""
+        valores, izquierdas, derechas = self.valores, self.izquierdas, self.derechas
+        resultado = None
+        nodo = self.raiz
+        while nodo != _NULO:
+            if valores[nodo] < valor or (incluir_igual and valores[nodo] == valor):
+                resultado = valores[nodo]
+                nodo = derechas[nodo]
+            else:
+                nodo = izquierdas[nodo]
+        return resultado
+    
+    def _siguiente(self, valor, incluir_igual):
+        """Devuelve el menor valor mayor que valor (o igual, si incluir_igual) en O(altura), o None."""
+        valores, izquierdas, derechas = self.valores, self.izquierdas, self.derechas
+        resultado = None
+        nodo = self.raiz
+        while nodo != _NULO:
+            if valor < valores[nodo] or (incluir_igual and valores[nodo] == valor):
+                resultado = valores[nodo]
+                nodo = izquierdas[nodo]
+            else:
+                nodo = derechas[nodo]
+        return resultado
+    
+    def ancestro_comun(self, p, q):
+        """Encuentra el ancestro común más cercano de dos valores en O(altura), o None."""
+        if q < p:
+            p, q = q, p
+        
+        valores, izquierdas, derechas = self.valores, self.izquierdas, self.derechas
+        nodo = self.raiz
+        while nodo != _NULO:
+            if valores[nodo] < p:
+                nodo = derechas[nodo]
+            elif q < valores[nodo]:
+                nodo = izquierdas[nodo]
+            else:
+                break
+        
+        if nodo == _NULO or not (self._contiene_desde(nodo, p) and self._contiene_desde(nodo, q)):
+            return None
+        return valores[nodo]
+    
+    def _contiene_desde(self, nodo, valor):
+        """Busca un valor en el subárbol de nodo en O(altura)."""
+        valores = self.valores
+        while nodo != _NULO:
+            if valor == valores[nodo]:
+                return True
+            nodo = self.izquierdas[nodo] if valor < valores[nodo] else self.derechas[nodo]
+        return False
+    
+    def altura(self):
+        """Devuelve la altura del árbol, almacenada en la raíz."""
+        return self.alturas[self.raiz] if self.raiz != _NULO else 0
+    
+    def esta_balanceado(self):
+        """Verifica si el árbol está balanceado en una sola pasada O(n)."""
+        izquierdas, derechas, alturas = self.izquierdas, self.derechas, self.alturas
+        pila = [self.raiz] if self.raiz != _NULO else []
+        while pila:
+            nodo = pila.pop()
+            izquierda, derecha = izquierdas[nodo], derechas[nodo]
+            altura_izquierda = alturas[izquierda] if izquierda != _NULO else 0
+            altura_derecha = alturas[derecha] if derecha != _NULO else 0
+            
+            if abs(altura_izquierda - altura_derecha) > 1:
+                return False
+            
+            if izquierda != _NULO:
+                pila.append(izquierda)
+            if derecha != _NULO:
+                pila.append(derecha)
+        
+        return True
+    
+    def imprimir_estructura(self):
+        """Imprime la estructura del árbol en forma visual."""
+        pila = [(self.raiz, "", True)]
+        
+        while pila:
+            nodo, prefijo, es_ultimo = pila.pop()
+            if nodo == _NULO:
+                continue
+            
+            print(prefijo + ("└── " if es_ultimo else "├── ") + str(self.valores[nodo]))
+            
+            # Prepara el prefijo para los hijos
+            nuevo_prefijo = prefijo + ("    " if es_ultimo else "│   ")
+            
+            # Imprime el hijo derecho primero, luego el izquierdo (la pila invierte el orden)
+            izquierda = self.izquierdas[nodo]
+            pila.append((izquierda, nuevo_prefijo, True))
+            pila.append((self.derechas[nodo], nuevo_prefijo, izquierda == _NULO))
 
 
 def balancear_arbol(arbol):
@@ -106,6 +1071,14 @@ def balancear_arbol(arbol):
     Returns:
         Un nuevo ArbolBinarioBusqueda balanceado con los mismos nodos.
     """
+    if getattr(arbol, "compactar_duplicados", False):
+        # Conserva un nodo por valor distinto junto con su contador de ocurrencias
+        nodos = arbol._nodos_inorden(arbol.raiz)
+        arbol_balanceado = ArbolBinarioBusqueda(compactar_duplicados=True)
+        arbol_balanceado.raiz = _construir_arbol_balanceado(
+            [nodo.valor for nodo in nodos], 0, len(nodos) - 1, [nodo.cuenta for nodo in nodos])
+        return arbol_balanceado
+    
     # Paso 1: Realizar un recorrido inorden para obtener un array ordenado de valores
     valores_ordenados = arbol.recorrido_inorden()
     
@@ -115,15 +1088,17 @@ def balancear_arbol(arbol):
     
     return arbol_balanceado
 
-def _construir_arbol_balanceado(valores, inicio, fin):
+def _construir_arbol_balanceado(valores, inicio, fin, cuentas=None):
     """
-    Función auxiliar recursiva para construir un árbol balanceado.
-    Utiliza una estrategia de divide y vencerás.
+    Función auxiliar para construir un árbol balanceado.
+    Utiliza una estrategia de divide y vencerás con una pila explícita.
     
     Args:
         valores: Lista ordenada de valores.
         inicio: Índice de inicio.
         fin: Índice de fin.
+        cuentas: Lista opcional con las ocurrencias de cada valor, para
+            árboles con compactar_duplicados.
         
     Returns:
         La raíz del árbol balanceado.
@@ -132,17 +1107,174 @@ def _construir_arbol_balanceado(valores, inicio, fin):
     if inicio > fin:
         return None
     
-    # Encuentra el elemento medio y lo usa como raíz
-    medio = (inicio + fin) // 2
-    nodo = Nodo(valores[medio])
+    # Crea todos los nodos de una vez: nodos[i] guarda valores[i] y los hijos
+    # se enlazan por índice
+    nodos = [None] * inicio
+    nodos.extend(map(Nodo, valores[inicio:fin + 1]))
+    
+    if cuentas is not None:
+        # Con contadores, el tamaño de valores[i:j] es acumuladas[j] - acumuladas[i]
+        acumuladas = list(accumulate(cuentas, initial=0))
+        for i in range(inicio, fin + 1):
+            nodo = nodos[i]
+            nodo.cuenta = nodo.tamano = cuentas[i]
     
-    # Construye recursivamente los subárboles izquierdo y derecho
-    nodo.izquierda = _construir_arbol_balanceado(valores, inicio, medio - 1)
-    nodo.derecha = _construir_arbol_balanceado(valores, medio + 1, fin)
+    # La pila solo guarda rangos de valores. Al dividir siempre por el medio,
+    # un subárbol de m valores tiene altura m.bit_length(); los rangos de
+    # hasta tres valores se terminan sin apilarlos, porque sus hijos son hojas
+    # que ya tienen la altura y el tamaño correctos.
+    raiz = nodos[(inicio + fin) // 2]
+    pila = [(inicio, fin)]
+    while pila:
+        inicio, fin = pila.pop()
+        medio = (inicio + fin) // 2
+        nodo = nodos[medio]
+        
+        cantidad = fin - inicio + 1
+        nodo.altura = cantidad.bit_length()
+        nodo.tamano = cantidad if cuentas is None else acumuladas[fin + 1] - acumuladas[inicio]
+        
+        if cantidad > 3:
+            # Subárboles valores[inicio:medio] y valores[medio + 1:fin + 1]
+            nodo.izquierda = nodos[(inicio + medio - 1) // 2]
+            nodo.derecha = nodos[(medio + 1 + fin) // 2]
+            pila.append((inicio, medio - 1))
+            pila.append((medio + 1, fin))
+        elif cantidad == 3:
+            nodo.izquierda = nodos[inicio]
+            nodo.derecha = nodos[fin]
+        elif cantidad == 2:
+            nodo.derecha = nodos[fin]
     
-    return nodo
+    return raiz
 
 
+def serializar_preorden(arbol):
+    """
+    Serializa un árbol binario de búsqueda como la lista de sus valores en preorden.
+    
+    A diferencia del formato por niveles, no hace falta escribir ningún "null":
+    el orden del árbol más el preorden determinan su forma, siempre que los
+    valores repetidos estén a la derecha, como los deja insertar. Con
+    compactar_duplicados cada valor se repite tantas veces como su contador.
+    
+    Args:
+        arbol: Un objeto ArbolBinarioBusqueda.
+        
+    Returns:
+        Una cadena de texto de la forma "[5,3,1,4,8]".
+        
+    Raises:
+        ValueError: Si un valor repetido quedó en un subárbol izquierdo (por
+            rotaciones o balanceos), porque entonces la forma no es recuperable.
+    """
+    resultado = []
+    # Cada entrada es un nodo y el valor del ancestro más cercano del que
+    # desciende por la izquierda: todo su subárbol debe ser menor que él
+    pila = [(arbol.raiz, None)] if arbol.raiz is not None else []
+    
+    while pila:
+        nodo, limite = pila.pop()
+        if limite is not None and not nodo.valor < limite:
+            raise ValueError("El preorden no determina la forma: hay valores repetidos a la izquierda")
+        
+        texto = str(nodo.valor)
+        resultado.extend([texto] * nodo.cuenta)
+        
+        # Se apila primero el derecho para visitar antes el izquierdo
+        if nodo.derecha is not None:
+            pila.append((nodo.derecha, limite))
+        if nodo.izquierda is not None:
+            pila.append((nodo.izquierda, nodo.valor))
+    
+    return "[" + ",".join(resultado) + "]"
+
+
+def deserializar_preorden(datos, compactar_duplicados=False):
+    """
+    Reconstruye en O(n) un árbol binario de búsqueda a partir de su preorden.
+    
+    Recorre los valores una sola vez con una pila de ancestros: cada valor es
+    hijo izquierdo de la cima si es menor que ella; si no, es hijo derecho del
+    último ancestro desapilado que no sea mayor que él. Si ese ancestro tiene
+    el mismo valor, el valor es una repetición y solo incrementa su contador,
+    de modo que da igual con qué modo se serializó el árbol:
+    
+    - Con compactar_duplicados=False, cada nodo con contador k se convierte
+      en la cadena de k copias hacia la derecha que habría creado insertar.
+    - Con compactar_duplicados=True, si algún valor sigue repetido en nodos
+      separados (árboles sin compactar reconstruidos por balancear o por alfa),
+      el árbol se reconstruye balanceado con un nodo por valor distinto.
+    
+    Args:
+        datos: Una cadena de texto generada por serializar_preorden.
+        compactar_duplicados: Modo del árbol resultante (ver ArbolBinarioBusqueda).
+        
+    Returns:
+        Un nuevo ArbolBinarioBusqueda.
+    """
+    arbol = ArbolBinarioBusqueda(compactar_duplicados=compactar_duplicados)
+    datos = datos.strip("[]")
+    if not datos:
+        return arbol
+    
+    valores = map(int, datos.split(","))
+    arbol.raiz = Nodo(next(valores))
+    pila = [arbol.raiz]
+    vistos = {arbol.raiz.valor}
+    contados = []
+    separados = False
+    
+    for valor in valores:
+        cima = pila[-1]
+        if valor < cima.valor:
+            nodo = Nodo(valor)
+            cima.izquierda = nodo
+        else:
+            # Sube hasta el último ancestro del que nodo es hijo derecho
+            padre = pila.pop()
+            while pila and not valor < pila[-1].valor:
+                padre = pila.pop()
+            
+            if padre.valor == valor:
+                # Repetición: en ambos modos las copias quedan seguidas a la derecha
+                padre.cuenta += 1
+                if padre.cuenta == 2:
+                    contados.append(padre)
+                pila.append(padre)
+                continue
+            
+            nodo = Nodo(valor)
+            padre.derecha = nodo
+        
+        if valor in vistos:
+            separados = True
+        vistos.add(valor)
+        pila.append(nodo)
+    
+    if compactar_duplicados:
+        if separados:
+            # Un nodo por valor distinto, sumando los contadores de sus copias
+            grupos = groupby(arbol._nodos_inorden(arbol.raiz), key=lambda nodo: nodo.valor)
+            valores_distintos = []
+            cuentas = []
+            for valor, nodos in grupos:
+                valores_distintos.append(valor)
+                cuentas.append(sum(nodo.cuenta for nodo in nodos))
+            arbol.raiz = _construir_arbol_balanceado(valores_distintos, 0, len(valores_distintos) - 1, cuentas)
+            return arbol
+    else:
+        for nodo in contados:
+            cuenta, nodo.cuenta = nodo.cuenta, 1
+            derecha = nodo.derecha
+            for _ in range(cuenta - 1):
+                nodo.derecha = Nodo(nodo.valor)
+                nodo = nodo.derecha
+            nodo.derecha = derecha
+    
+    arbol._recalcular_subarbol(arbol.raiz)
+    return arbol
+
 # Pruebas para la función de balanceo de árbol
 def probar_balanceo_arbol():
     """Prueba la función balancear_arbol."""
@@ -225,6 +1357,122 @@ def probar_balanceo_arbol():
     print(f"¿Está balanceado? {balanceado5.esta_balanceado()}")
     print(f"Recorrido inorden original: {arbol5.recorrido_inorden()}")
     print(f"Recorrido inorden balanceado: {balanceado5.recorrido_inorden()}")
+    
+    # Caso de prueba 6: Modo autobalanceado (AVL) con inserciones ordenadas
+    print("\n--- Caso de prueba 6: Modo autobalanceado (AVL) ---")
+    arbol6 = ArbolBinarioBusqueda(autobalanceado=True)
+    for val in [1, 2, 3, 4, 5, 6, 7]:
+        arbol6.insertar(val)
+    
+    print("Árbol tras insertar 1..7 en orden:")
+    arbol6.imprimir_estructura()
+    print(f"¿Está balanceado? {arbol6.esta_balanceado()}")
+    print(f"Altura: {arbol6.altura()}")
+    
+    for val in [1, 2, 3]:
+        arbol6.eliminar(val)
+    print("\nÁrbol tras eliminar 1, 2 y 3:")
+    arbol6.imprimir_estructura()
+    print(f"¿Está balanceado? {arbol6.esta_balanceado()}")
+    print(f"Recorrido inorden: {arbol6.recorrido_inorden()}")
+    
+    # Caso de prueba 7: Carga masiva desde un generador
+    print("\n--- Caso de prueba 7: Carga masiva desde un generador ---")
+    arbol7 = ArbolBinarioBusqueda.desde_iterable(x * 3 % 10 for x in range(10))
+    
+    print("Árbol cargado:")
+    arbol7.imprimir_estructura()
+    print(f"¿Está balanceado? {arbol7.esta_balanceado()}")
+    print(f"Recorrido inorden: {arbol7.recorrido_inorden()}")
+    
+    # Caso de prueba 8: Balanceo en el lugar (Day-Stout-Warren)
+    print("\n--- Caso de prueba 8: Balanceo en el lugar ---")
+    arbol8 = ArbolBinarioBusqueda()
+    for val in [1, 2, 3, 4, 5, 6]:
+        arbol8.insertar(val)
+    
+    print(f"¿Está balanceado antes? {arbol8.esta_balanceado()}")
+    arbol8.balancear()
+    print("Árbol tras balancear():")
+    arbol8.imprimir_estructura()
+    print(f"¿Está balanceado? {arbol8.esta_balanceado()}")
+    print(f"Recorrido inorden: {arbol8.recorrido_inorden()}")
+    
+    # Caso de prueba 9: Iterador perezoso y consultas por rango
+    print("\n--- Caso de prueba 9: Iterador perezoso y consultas por rango ---")
+    arbol9 = ArbolBinarioBusqueda.desde_iterable(range(0, 100, 5))
+    
+    print(f"Primeros 3 valores: {list(islice(arbol9.iterar_inorden(), 3))}")
+    print(f"Valores en [23, 51): {list(arbol9.iterar_rango(23, 51))}")
+    
+    # Caso de prueba 10: Estadísticos de orden
+    print("\n--- Caso de prueba 10: Estadísticos de orden ---")
+    print(f"Mediana (k = {len(arbol9) // 2}): {arbol9.k_esimo(len(arbol9) // 2)}")
+    print(f"Valores menores que 42: {arbol9.rango(42)}")
+    print(f"Valores en [23, 51): {arbol9.contar_entre(23, 51)}")
+    
+    # Caso de prueba 11: Almacenamiento compacto en arreglos
+    print("\n--- Caso de prueba 11: Almacenamiento compacto en arreglos ---")
+    arbol11 = ArbolBinarioBusquedaCompacto()
+    for val in [4, 2, 6, 1, 3, 5, 7]:
+        arbol11.insertar(val)
+    
+    print("Árbol original:")
+    arbol11.imprimir_estructura()
+    print(f"¿Está balanceado? {arbol11.esta_balanceado()}")
+    print(f"Recorrido inorden: {arbol11.recorrido_inorden()}")
+    print(f"Bytes por nodo: {sum(a.itemsize for a in (arbol11.valores, arbol11.izquierdas, arbol11.derechas, arbol11.alturas, arbol11.tamanos))}")
+    
+    # Caso de prueba 12: Reconstrucción parcial tipo chivo expiatorio
+    print("\n--- Caso de prueba 12: Reconstrucción parcial (alfa = 0.7) ---")
+    arbol12 = ArbolBinarioBusqueda(alfa=0.7)
+    for val in range(1, 16):
+        arbol12.insertar(val)
+    
+    print("Árbol tras insertar 1..15 en orden:")
+    arbol12.imprimir_estructura()
+    print(f"Altura: {arbol12.altura()}")
+    print(f"Recorrido inorden: {arbol12.recorrido_inorden()}")
+    
+    # Caso de prueba 13: Compactación de valores repetidos
+    print("\n--- Caso de prueba 13: Compactación de valores repetidos ---")
+    arbol13 = ArbolBinarioBusqueda(compactar_duplicados=True)
+    for val in [3, 1, 3, 3, 2, 1, 3]:
+        arbol13.insertar(val)
+    
+    print("Árbol (un nodo por valor distinto):")
+    arbol13.imprimir_estructura()
+    print(f"Recorrido inorden: {arbol13.recorrido_inorden()}")
+    print(f"Recorrido inorden balanceado: {balancear_arbol(arbol13).recorrido_inorden()}")
+    
+    # Caso de prueba 14: Serialización en preorden sin "null"
+    print("\n--- Caso de prueba 14: Serialización en preorden sin \"null\" ---")
+    serializado14 = serializar_preorden(arbol2)
+    print(f"Serializado: {serializado14}")
+    
+    arbol14 = deserializar_preorden(serializado14)
+    print("Árbol deserializado:")
+    arbol14.imprimir_estructura()
+    print(f"Recorrido inorden: {arbol14.recorrido_inorden()}")
+    
+    # Un árbol compactado se puede leer en cualquiera de los dos modos
+    serializado14 = serializar_preorden(arbol13)
+    print(f"Serializado con repetidos: {serializado14}")
+    for compactar in (False, True):
+        arbol14 = deserializar_preorden(serializado14, compactar_duplicados=compactar)
+        print(f"Con compactar_duplicados={compactar}: inorden {arbol14.recorrido_inorden()}, "
+              f"menores que 2: {arbol14.rango(2)}, tamaño: {len(arbol14)}")
+    
+    # Caso de prueba 15: Ancestro común, piso, techo, sucesor y predecesor
+    print("\n--- Caso de prueba 15: Ancestro común, piso, techo, sucesor y predecesor ---")
+    arbol15 = ArbolBinarioBusqueda.desde_iterable([1, 3, 5, 7, 9, 11, 13])
+    arbol15.imprimir_estructura()
+    print(f"Ancestro común más cercano de 1 y 5: {arbol15.ancestro_comun(1, 5)}")
+    print(f"Ancestro común más cercano de 9 y 13: {arbol15.ancestro_comun(9, 13)}")
+    print(f"Ancestro común más cercano de 1 y 4: {arbol15.ancestro_comun(1, 4)}")
+    print(f"Piso y techo de 6: {arbol15.piso(6)}, {arbol15.techo(6)}")
+    print(f"Predecesor y sucesor de 7: {arbol15.predecesor(7)}, {arbol15.sucesor(7)}")
+    print(f"Sucesor de 13: {arbol15.sucesor(13)}")
 
 # Ejecutar las pruebas
 if __name__ == "__main__":
@@ -1,4 +1,37 @@
+import io
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+from array import array
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo usa deserializar_enteros
+    np = None
+
+# Formato binario: cabecera con la firma, el código de tipo de los valores
+# (módulo array) y la cantidad de posiciones del recorrido por niveles
+_FIRMA_BINARIA = b"AB"
+_CABECERA_BINARIA = struct.Struct("<2scQ")
+_BITS_A_TEXTO = bytes.maketrans(b"\x00\x01", b"01")
+
+# La vista sobre el formato binario guarda cuántos bits a 1 hay antes de
+# cada bloque del mapa de bits, para calcular rangos en O(1)
+_BYTES_POR_BLOQUE_RANGO = 64
+
+# Tamaños de bloque por defecto para la serialización en flujos
+_VALORES_POR_BLOQUE = 4096
+_CARACTERES_POR_BLOQUE = 1 << 16
+
+# La serialización en paralelo busca al menos tantos fragmentos por proceso
+_FRAGMENTOS_POR_PROCESO = 4
+
+# Subárboles que heredan los procesos de serializar_paralelo
+_fragmentos_trabajador = None
 
 class NodoArbol:
     """Clase para representar un nodo en un árbol binario."""
@@ -10,10 +43,25 @@ class NodoArbol:
 class ArbolBinario:
     """Clase para representar un árbol binario."""
     def __init__(self):
+        # Huellas de los subárboles calculadas para la raíz _raiz_huellas
+        self._huellas = None
+        self._raiz_huellas = None
         self.raiz = None
     
+    @property
+    def raiz(self):
+        """La raíz del árbol, o None si está vacío."""
+        return self._raiz
+    
+    @raiz.setter
+    def raiz(self, raiz):
+        """Cambia la raíz; aunque sea el mismo nodo, descarta las huellas guardadas."""
+        self._raiz = raiz
+        self.invalidar_huellas()
+    
     def construir_arbol_desde_lista(self, lista):
         """Construye un árbol binario a partir de una lista de valores en orden de nivel."""
+        self.invalidar_huellas()
         if not lista:
             return
         
@@ -36,6 +84,33 @@ class ArbolBinario:
                 cola.append(nodo_actual.derecha)
             i += 1
     
+    def huellas(self):
+        """
+        Devuelve las huellas estructurales de todos los subárboles (ver calcular_huellas).
+        
+        Se calculan una vez en O(n) y se reutilizan mientras el árbol no cambie.
+        Asignar la raíz, reconstruir el árbol o aplicar_parche las invalidan
+        automáticamente; si se modifican nodos directamente hay que llamar a
+        invalidar_huellas(), o es_igual puede dar falsos negativos.
+        """
+        if self._huellas is None or self._raiz_huellas is not self.raiz:
+            self._huellas = calcular_huellas(self.raiz)
+            self._raiz_huellas = self.raiz
+        return self._huellas
+    
+    def invalidar_huellas(self):
+        """Descarta las huellas guardadas tras modificar el árbol."""
+        self._huellas = None
+        self._raiz_huellas = None
+    
+    def aplicar_parche(self, parche):
+        """Aplica un parche de calcular_parche al árbol y descarta sus huellas."""
+        self.raiz = aplicar_parche(self.raiz, parche)
+    
+    def es_igual(self, otro):
+        """Compara con otro ArbolBinario, descartando en O(1) si sus huellas difieren."""
+        return son_arboles_iguales(self.raiz, otro.raiz, self.huellas(), otro.huellas())
+    
     def imprimir_estructura(self):
         """Imprime la estructura del árbol en forma visual."""
         self._imprimir_estructura_recursivo(self.raiz, "", True)
@@ -54,12 +129,124 @@ class ArbolBinario:
                 self._imprimir_estructura_recursivo(nodo.izquierda, nuevo_prefijo, True)
 
 
-def serializar(raiz):
+class Codec:
+    """
+    Interfaz de los codecs de valores para serializar y deserializar.
+    
+    Un codec convierte de una vez todos los valores de un árbol (en orden por
+    niveles) en un único bloque de texto, y lo vuelve a convertir sabiendo
+    cuántos valores contiene. serializar escribe el bloque entre el primer "|"
+    y el "]" final, y deserializar lo recupera quitando solo el primer y el
+    último carácter y cortando por el primer "|", así que el bloque puede
+    contener cualquier carácter, incluidos "|", "," y "]".
+    """
+    def codificar(self, valores):
+        """
+        Args:
+            valores: Lista con los valores de los nodos.
+            
+        Returns:
+            Una cadena de texto con todos los valores codificados.
+        """
+        raise NotImplementedError
+    
+    def decodificar(self, bloque, cantidad):
+        """
+        Args:
+            bloque: Una cadena de texto generada por codificar.
+            cantidad: Cuántos valores contiene el bloque (puede ser 0).
+            
+        Returns:
+            Una lista con los valores, en el mismo orden en que se codificaron.
+        """
+        raise NotImplementedError
+
+
+class CodecEntero(Codec):
+    """Codec de enteros (int64) para serializar y deserializar."""
+    def codificar(self, valores):
+        """Escribe los enteros en decimal separados por comas."""
+        return ",".join(map(str, valores))
+    
+    def decodificar(self, bloque, cantidad):
+        """Lee cantidad enteros escritos por codificar."""
+        return list(map(int, bloque.split(","))) if cantidad else []
+
+
+class CodecFlotante(Codec):
+    """Codec de números de coma flotante (float64); repr los conserva exactos."""
+    def codificar(self, valores):
+        """Escribe los números con repr separados por comas."""
+        return ",".join(map(repr, valores))
+    
+    def decodificar(self, bloque, cantidad):
+        """Lee cantidad números escritos por codificar."""
+        return list(map(float, bloque.split(","))) if cantidad else []
+
+
+class CodecTexto(Codec):
+    """
+    Codec de cadenas de texto con prefijo de longitud.
+    
+    Cada valor se escribe como "longitud:texto", sin separadores, así que el
+    texto puede contener comas, corchetes o cualquier otro carácter. Como el
+    formato es texto, la longitud cuenta caracteres, no bytes UTF-8; al
+    guardar el resultado en UTF-8 el bloque sigue siendo válido.
+    """
+    def codificar(self, valores):
+        """Escribe cada cadena precedida de su longitud en caracteres y ":"."""
+        return "".join([f"{len(valor)}:{valor}" for valor in valores])
+    
+    def decodificar(self, bloque, cantidad):
+        """Lee cantidad cadenas escritas por codificar."""
+        valores = []
+        inicio = 0
+        for _ in range(cantidad):
+            separador = bloque.index(":", inicio)
+            fin = separador + 1 + int(bloque[inicio:separador])
+            valores.append(bloque[separador + 1:fin])
+            inicio = fin
+        return valores
+
+
+class CodecTupla(Codec):
+    """
+    Codec de tuplas de tamaño fijo, con un codec por componente.
+    
+    Los valores se codifican por columnas: cada componente se pasa completo a
+    su codec y el bloque resultante se escribe con prefijo de longitud.
+    """
+    def __init__(self, *componentes):
+        """
+        Args:
+            componentes: Un codec por cada posición de la tupla.
+        """
+        self.componentes = componentes
+    
+    def codificar(self, valores):
+        """Codifica cada columna con su codec y une los bloques con prefijo de longitud."""
+        columnas = zip(*valores) if valores else [()] * len(self.componentes)
+        bloques = [codec.codificar(list(columna)) for codec, columna in zip(self.componentes, columnas)]
+        return "".join([f"{len(bloque)}:{bloque}" for bloque in bloques])
+    
+    def decodificar(self, bloque, cantidad):
+        """Separa los bloques de cada columna, los decodifica y vuelve a formar las tuplas."""
+        bloques = CodecTexto().decodificar(bloque, len(self.componentes))
+        columnas = [codec.decodificar(texto, cantidad) for codec, texto in zip(self.componentes, bloques)]
+        return list(zip(*columnas)) if columnas else [()] * cantidad
+
+
+def serializar(raiz, codec=None):
     """
     Serializa un árbol binario a una cadena de texto.
     
     Args:
         raiz: La raíz del árbol binario.
+        codec: Codec de los valores (CodecEntero, CodecFlotante, CodecTexto,
+            CodecTupla o cualquier objeto con la interfaz de Codec). Con un
+            codec, la forma del árbol se escribe como un mapa de bits por
+            niveles seguido de "|" y de los valores codificados de una vez:
+            "[1101|...]".
         
     Returns:
         Una cadena de texto que representa el árbol serializado.
@@ -67,6 +254,9 @@ def serializar(raiz):
     if not raiz:
         return "[]"
     
+    if codec is not None:
+        return _serializar_con_codec(raiz, codec)
+    
     resultado = []
     cola = deque([raiz])
     
@@ -87,16 +277,20 @@ def serializar(raiz):
     return "[" + ",".join(resultado) + "]"
 
 
-def deserializar(datos):
+def deserializar(datos, codec=None):
     """
     Deserializa una cadena de texto para reconstruir un árbol binario.
     
     Args:
         datos: Una cadena de texto que representa el árbol serializado.
+        codec: El mismo codec que se usó al serializar, o None.
         
     Returns:
         La raíz del árbol binario reconstruido.
     """
+    if codec is not None:
+        return _deserializar_con_codec(datos, codec)
+    
     # Eliminar los corchetes y dividir por comas
     datos = datos.strip("[]")
     if not datos:
@@ -127,13 +321,496 @@ def deserializar(datos):
     return raiz
 
 
-def son_arboles_iguales(raiz1, raiz2):
+def _serializar_con_codec(raiz, codec):
+    """Serializa un árbol no vacío como mapa de bits y bloque de valores."""
+    bits = []
+    valores = []
+    nivel = [raiz]
+    
+    while nivel:
+        siguiente = []
+        for nodo in nivel:
+            if nodo:
+                bits.append("1")
+                valores.append(nodo.valor)
+                siguiente.append(nodo.izquierda)
+                siguiente.append(nodo.derecha)
+            else:
+                bits.append("0")
+        nivel = siguiente
+    
+    return "[" + "".join(bits).rstrip("0") + "|" + codec.codificar(valores) + "]"
+
+
+def _deserializar_con_codec(datos, codec):
+    """Reconstruye un árbol escrito por _serializar_con_codec."""
+    # Solo se quitan los corchetes exteriores: los valores pueden contenerlos
+    datos = datos[1:-1]
+    if not datos:
+        return None
+    
+    bits, _, bloque = datos.partition("|")
+    valores = iter(codec.decodificar(bloque, bits.count("1")))
+    
+    raiz = NodoArbol(next(valores))
+    cola = deque([raiz])
+    i = 1
+    
+    while cola and i < len(bits):
+        nodo_actual = cola.popleft()
+        
+        if bits[i] == "1":
+            nodo_actual.izquierda = NodoArbol(next(valores))
+            cola.append(nodo_actual.izquierda)
+        i += 1
+        
+        if i < len(bits) and bits[i] == "1":
+            nodo_actual.derecha = NodoArbol(next(valores))
+            cola.append(nodo_actual.derecha)
+        i += 1
+    
+    return raiz
+
+
+def serializar_a(flujo, raiz, valores_por_bloque=_VALORES_POR_BLOQUE):
+    """
+    Serializa un árbol binario escribiéndolo por bloques en un flujo de texto.
+    
+    Produce exactamente la misma cadena que serializar, pero sin construirla
+    entera en memoria: los valores se escriben en bloques de tamaño acotado y
+    los "null" se cuentan hasta saber si les sigue algún valor.
+    
+    Args:
+        flujo: Objeto de tipo archivo abierto en modo texto (con write).
+        raiz: La raíz del árbol binario.
+        valores_por_bloque: Cantidad aproximada de valores por escritura.
+    """
+    flujo.write("[")
+    
+    bloque = []
+    separador = ""
+    nulos_pendientes = 0
+    cola = deque([raiz] if raiz else [])
+    
+    while cola:
+        nodo = cola.popleft()
+        
+        if nodo is None:
+            # Los "null" solo se escriben si más adelante aparece algún valor
+            nulos_pendientes += 1
+            continue
+        
+        if nulos_pendientes:
+            bloque.extend(["null"] * nulos_pendientes)
+            nulos_pendientes = 0
+        bloque.append(str(nodo.valor))
+        cola.append(nodo.izquierda)
+        cola.append(nodo.derecha)
+        
+        if len(bloque) >= valores_por_bloque:
+            flujo.write(separador + ",".join(bloque))
+            separador = ","
+            bloque.clear()
+    
+    if bloque:
+        flujo.write(separador + ",".join(bloque))
+    flujo.write("]")
+
+
+def _leer_valores(flujo, caracteres_por_bloque):
+    """Genera uno a uno los valores de texto leídos por bloques de un flujo serializado."""
+    resto = ""
+    primer_bloque = True
+    
+    while True:
+        bloque = flujo.read(caracteres_por_bloque)
+        if not bloque:
+            break
+        if primer_bloque:
+            bloque = bloque.lstrip("[")
+            primer_bloque = False
+        
+        # El último fragmento puede ser un valor cortado a mitad de bloque
+        partes = (resto + bloque).split(",")
+        resto = partes.pop()
+        yield from partes
+    
+    resto = resto.strip().rstrip("]")
+    if resto:
+        yield resto
+
+
+def deserializar_de(flujo, caracteres_por_bloque=_CARACTERES_POR_BLOQUE):
+    """
+    Deserializa un árbol binario leyéndolo por bloques de un flujo de texto.
+    
+    Acepta el mismo formato que deserializar, pero nunca tiene en memoria más
+    que un bloque de texto además del propio árbol.
+    
+    Args:
+        flujo: Objeto de tipo archivo abierto en modo texto (con read).
+        caracteres_por_bloque: Cantidad de caracteres leídos en cada lectura.
+        
+    Returns:
+        La raíz del árbol binario reconstruido.
+    """
+    valores = _leer_valores(flujo, caracteres_por_bloque)
+    
+    primero = next(valores, None)
+    if primero is None:
+        return None
+    
+    raiz = NodoArbol(int(primero))
+    cola = deque([raiz])
+    
+    while cola:
+        nodo_actual = cola.popleft()
+        
+        # Hijo izquierdo
+        valor = next(valores, None)
+        if valor is None:
+            break
+        if valor != "null":
+            nodo_actual.izquierda = NodoArbol(int(valor))
+            cola.append(nodo_actual.izquierda)
+        
+        # Hijo derecho
+        valor = next(valores, None)
+        if valor is None:
+            break
+        if valor != "null":
+            nodo_actual.derecha = NodoArbol(int(valor))
+            cola.append(nodo_actual.derecha)
+    
+    return raiz
+
+
+def deserializar_enteros(datos, como_arreglos=False):
+    """
+    Deserializa con NumPy una cadena de serializar cuyos valores son enteros.
+    
+    Es la misma lógica de cola que deserializar, expresada como operaciones
+    sobre arreglos: el r-ésimo valor no nulo tiene sus hijos en las posiciones
+    2r + 1 y 2r + 2, y el índice de cada hijo entre los nodos es la suma
+    acumulada de la máscara de no nulos. Todo el análisis del texto y el
+    cálculo de enlaces se hace en código vectorizado.
+    
+    Args:
+        datos: Una cadena de texto generada por serializar, sin espacios y con
+            valores que caben en 64 bits.
+        como_arreglos: Si es True, devuelve los arreglos de índices en lugar de
+            construir nodos.
+        
+    Returns:
+        La raíz del árbol binario reconstruido o, con como_arreglos, una tupla
+        (valores, izquierdas, derechas) de arreglos int64 donde el nodo 0 es la
+        raíz y -1 indica un hijo vacío.
+    """
+    if np is None:
+        raise ImportError("deserializar_enteros necesita NumPy")
+    
+    cuerpo = datos.strip("[]")
+    if not cuerpo:
+        vacio = np.empty(0, dtype=np.int64)
+        return (vacio, vacio.copy(), vacio.copy()) if como_arreglos else None
+    
+    # Un valor es nulo si su primer carácter es la "n" de "null"
+    caracteres = np.frombuffer(cuerpo.encode("ascii"), dtype=np.uint8)
+    inicios = np.concatenate(([0], np.flatnonzero(caracteres == ord(",")) + 1))
+    no_nulos = caracteres[inicios] != ord("n")
+    
+    # Cada "null" pasa a "   0" (mismo largo) para analizar todo de una vez
+    todos = np.fromstring(cuerpo.replace("null", "   0"), dtype=np.int64, sep=",")
+    valores = todos[no_nulos]
+    
+    # Índice entre los nodos de cada posición no nula
+    orden = np.cumsum(no_nulos) - 1
+    cantidad = len(valores)
+    posiciones = len(no_nulos)
+    
+    enlaces = []
+    for desplazamiento in (1, 2):
+        hijos = np.full(cantidad, -1, dtype=np.int64)
+        posicion_hijo = 2 * np.arange(cantidad, dtype=np.int64) + desplazamiento
+        en_rango = posicion_hijo < posiciones
+        posicion_hijo = posicion_hijo[en_rango]
+        hijos[en_rango] = np.where(no_nulos[posicion_hijo], orden[posicion_hijo], -1)
+        enlaces.append(hijos)
+    izquierdas, derechas = enlaces
+    
+    if como_arreglos:
+        return valores, izquierdas, derechas
+    
+    nodos = list(map(NodoArbol, valores.tolist()))
+    for atributo, hijos in (("izquierda", izquierdas), ("derecha", derechas)):
+        padres = np.flatnonzero(hijos >= 0)
+        for padre, hijo in zip(padres.tolist(), hijos[padres].tolist()):
+            setattr(nodos[padre], atributo, nodos[hijo])
+    
+    return nodos[0]
+
+
+def _comprobar_tipo(tipo):
+    """
+    Rechaza los códigos de tipo cuyo tamaño en array depende de la plataforma.
+    
+    El formato binario se escribe con array y se lee con struct (tamaños
+    estándar), así que ambos deben coincidir: "l" ocupa 8 bytes en array en
+    Linux de 64 bits pero 4 en struct.
+    """
+    try:
+        tamano_estandar = struct.calcsize("<" + tipo)
+    except struct.error:
+        tamano_estandar = None
+    if array(tipo).itemsize != tamano_estandar:
+        raise ValueError(f"El código de tipo {tipo!r} no tiene un tamaño fijo entre plataformas; "
+                         "usa uno como 'i', 'q' o 'd'")
+
+
+def serializar_binario(raiz, tipo="q"):
+    """
+    Serializa un árbol binario a un formato binario compacto.
+    
+    Recorre el árbol por niveles igual que serializar, pero en lugar de texto
+    escribe un mapa de bits con una posición por cada valor o "null" (1 si hay
+    nodo) seguido de los valores empaquetados con ancho fijo.
+    
+    Args:
+        raiz: La raíz del árbol binario.
+        tipo: Código de tipo del módulo array para los valores ("q" para
+            enteros de 64 bits, "d" para flotantes de 64 bits, etc.). Los
+            códigos de tamaño variable entre plataformas ("l", "L") no se
+            admiten.
+        
+    Returns:
+        Un objeto bytes con el árbol serializado.
+    """
+    _comprobar_tipo(tipo)
+    presencia = bytearray()
+    valores = array(tipo)
+    
+    if raiz:
+        presencia.append(1)
+        valores.append(raiz.valor)
+        nivel = [raiz]
+        while nivel:
+            hijos = [hijo for nodo in nivel for hijo in (nodo.izquierda, nodo.derecha)]
+            presencia += bytes([hijo is not None for hijo in hijos])
+            nivel = [hijo for hijo in hijos if hijo is not None]
+            valores.extend([nodo.valor for nodo in nivel])
+    
+    # Eliminar los "null" al final
+    presencia = presencia.rstrip(b"\x00")
+    
+    # Empaqueta una posición por bit, la primera en el bit más significativo
+    bits = int(presencia.translate(_BITS_A_TEXTO), 2) if presencia else 0
+    mapa = bits.to_bytes((len(presencia) + 7) // 8, "big")
+    
+    if sys.byteorder == "big":
+        valores.byteswap()
+    
+    return (_CABECERA_BINARIA.pack(_FIRMA_BINARIA, tipo.encode(), len(presencia)) +
+            mapa + valores.tobytes())
+
+
+def deserializar_binario(datos):
+    """
+    Reconstruye un árbol binario a partir del formato de serializar_binario.
+    
+    Args:
+        datos: Objeto bytes (o compatible) con el árbol serializado.
+        
+    Returns:
+        La raíz del árbol binario reconstruido.
+    """
+    firma, tipo, posiciones = _CABECERA_BINARIA.unpack_from(datos)
+    if firma != _FIRMA_BINARIA:
+        raise ValueError("Los datos no están en el formato binario de árbol")
+    _comprobar_tipo(tipo.decode())
+    
+    inicio_mapa = _CABECERA_BINARIA.size
+    inicio_valores = inicio_mapa + (posiciones + 7) // 8
+    if not posiciones:
+        return None
+    
+    bits = format(int.from_bytes(datos[inicio_mapa:inicio_valores], "big"), "b").zfill(posiciones)
+    valores = array(tipo.decode())
+    valores.frombytes(datos[inicio_valores:])
+    if sys.byteorder == "big":
+        valores.byteswap()
+    
+    # En el recorrido por niveles, los hijos del r-ésimo nodo existente
+    # ocupan las posiciones 2r + 1 y 2r + 2
+    siguiente_valor = iter(valores).__next__
+    raiz = NodoArbol(siguiente_valor())
+    nodos = [raiz]
+    agregar = nodos.append
+    
+    for r, posicion in enumerate(range(1, posiciones, 2)):
+        padre = nodos[r]
+        
+        # Hijo izquierdo
+        if bits[posicion] == "1":
+            padre.izquierda = NodoArbol(siguiente_valor())
+            agregar(padre.izquierda)
+        
+        # Hijo derecho
+        if posicion + 1 < posiciones and bits[posicion + 1] == "1":
+            padre.derecha = NodoArbol(siguiente_valor())
+            agregar(padre.derecha)
+    
+    return raiz
+
+
+class NodoVista:
+    """
+    Nodo de una VistaArbolBinario, decodificado bajo demanda.
+    
+    Ofrece valor, izquierda y derecha como un NodoArbol, por lo que puede
+    pasarse a los algoritmos de solo lectura que esperan uno. Cada acceso
+    crea un NodoVista nuevo, así que dos NodoVista son iguales (y tienen el
+    mismo hash) si señalan la misma posición de la misma vista; esto permite
+    usarlos como claves, por ejemplo en calcular_huellas.
+    """
+    __slots__ = ("_vista", "_orden")
+    
+    def __init__(self, vista, orden):
+        self._vista = vista
+        # Índice del nodo entre los nodos existentes en el recorrido por niveles
+        self._orden = orden
+    
+    def __eq__(self, otro):
+        """Dos NodoVista son iguales si señalan la misma posición de la misma vista."""
+        return (isinstance(otro, NodoVista) and otro._vista is self._vista and
+                otro._orden == self._orden)
+    
+    def __hash__(self):
+        """Hash coherente con __eq__: depende de la vista y de la posición."""
+        return hash((id(self._vista), self._orden))
+    
+    @property
+    def valor(self):
+        """El valor del nodo, leído del búfer en cada acceso."""
+        return self._vista._valor(self._orden)
+    
+    @property
+    def izquierda(self):
+        """El hijo izquierdo como un NodoVista nuevo, o None si no existe."""
+        return self._vista._nodo_en(2 * self._orden + 1)
+    
+    @property
+    def derecha(self):
+        """El hijo derecho como un NodoVista nuevo, o None si no existe."""
+        return self._vista._nodo_en(2 * self._orden + 2)
+
+
+class VistaArbolBinario:
+    """
+    Vista de solo lectura sobre un árbol serializado con serializar_binario.
+    
+    No construye ningún NodoArbol: cada acceso a raiz, izquierda o derecha
+    calcula la posición del nodo en el búfer (con un rango sobre el mapa de
+    bits) y lee su valor directamente. Abierta con abrir() trabaja sobre un
+    mmap del archivo, así que el arranque es casi inmediato y las páginas se
+    comparten entre procesos.
+    """
+    def __init__(self, datos):
+        """
+        Args:
+            datos: Búfer (bytes, memoryview, mmap...) en el formato de serializar_binario.
+        """
+        firma, tipo, posiciones = _CABECERA_BINARIA.unpack_from(datos)
+        if firma != _FIRMA_BINARIA:
+            raise ValueError("Los datos no están en el formato binario de árbol")
+        _comprobar_tipo(tipo.decode())
+        
+        self._datos = datos
+        self._posiciones = posiciones
+        self._formato_valor = struct.Struct("<" + tipo.decode())
+        
+        tamano_mapa = (posiciones + 7) // 8
+        self._inicio_mapa = _CABECERA_BINARIA.size
+        self._inicio_valores = self._inicio_mapa + tamano_mapa
+        # serializar_binario rellena con ceros al principio del mapa
+        self._relleno = tamano_mapa * 8 - posiciones
+        
+        # Bits a 1 acumulados antes de cada bloque del mapa
+        self._rangos_bloque = array("q", [0])
+        for inicio in range(self._inicio_mapa, self._inicio_valores, _BYTES_POR_BLOQUE_RANGO):
+            fin = min(inicio + _BYTES_POR_BLOQUE_RANGO, self._inicio_valores)
+            bits = int.from_bytes(datos[inicio:fin], "big").bit_count()
+            self._rangos_bloque.append(self._rangos_bloque[-1] + bits)
+        
+        self._mmap = None
+    
+    @classmethod
+    def abrir(cls, ruta):
+        """Abre un archivo escrito con serializar_binario mapeándolo en memoria."""
+        with open(ruta, "rb") as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        vista = cls(mapa)
+        vista._mmap = mapa
+        return vista
+    
+    def cerrar(self):
+        """Libera el mmap si la vista se abrió con abrir()."""
+        if self._mmap is not None:
+            self._datos = None
+            self._mmap.close()
+            self._mmap = None
+    
+    def __enter__(self):
+        """Permite usar la vista con with; se cierra al salir del bloque."""
+        return self
+    
+    def __exit__(self, *excepcion):
+        """Cierra la vista al salir del bloque with."""
+        self.cerrar()
+    
+    @property
+    def raiz(self):
+        """El nodo raíz de la vista, o None si el árbol está vacío."""
+        return self._nodo_en(0)
+    
+    def _nodo_en(self, posicion):
+        """Devuelve el nodo de una posición del recorrido por niveles, o None si es "null"."""
+        if posicion >= self._posiciones:
+            return None
+        
+        bit = self._relleno + posicion
+        byte = self._datos[self._inicio_mapa + (bit >> 3)]
+        if not byte >> (7 - (bit & 7)) & 1:
+            return None
+        return NodoVista(self, self._rango(bit))
+    
+    def _rango(self, bit):
+        """Cuenta los bits a 1 del mapa anteriores al bit indicado."""
+        bloque = bit // (_BYTES_POR_BLOQUE_RANGO * 8)
+        inicio = self._inicio_mapa + bloque * _BYTES_POR_BLOQUE_RANGO
+        fin = self._inicio_mapa + (bit >> 3)
+        
+        cantidad = self._rangos_bloque[bloque] + int.from_bytes(self._datos[inicio:fin], "big").bit_count()
+        resto = bit & 7
+        if resto:
+            cantidad += (self._datos[fin] >> (8 - resto)).bit_count()
+        return cantidad
+    
+    def _valor(self, orden):
+        """Lee el valor del nodo que ocupa el lugar orden entre los existentes."""
+        desplazamiento = self._inicio_valores + orden * self._formato_valor.size
+        return self._formato_valor.unpack_from(self._datos, desplazamiento)[0]
+
+
+def son_arboles_iguales(raiz1, raiz2, huellas1=None, huellas2=None):
     """
     Comprueba si dos árboles binarios son iguales en estructura y valores.
     
     Args:
         raiz1: La raíz del primer árbol.
         raiz2: La raíz del segundo árbol.
+        huellas1, huellas2: Huellas opcionales de cada árbol (ver
+            calcular_huellas). Si las de las raíces difieren, los árboles son
+            distintos sin necesidad de recorrerlos.
         
     Returns:
         True si los árboles son iguales, False en caso contrario.
@@ -146,12 +823,529 @@ def son_arboles_iguales(raiz1, raiz2):
     if not raiz1 or not raiz2:
         return False
     
+    # Huellas distintas implican árboles distintos; iguales no garantizan nada
+    if huellas1 is not None and huellas2 is not None and huellas1[raiz1] != huellas2[raiz2]:
+        return False
+    
     # Compara los valores y los subárboles recursivamente
     return (raiz1.valor == raiz2.valor and
             son_arboles_iguales(raiz1.izquierda, raiz2.izquierda) and
             son_arboles_iguales(raiz1.derecha, raiz2.derecha))
 
 
+def _nodos_hijos_primero(raiz):
+    """Devuelve los nodos del árbol en un orden en que cada hijo precede a su padre."""
+    # Preorden iterativo: recorrido al revés, los hijos preceden al padre
+    orden = []
+    pila = [raiz] if raiz else []
+    while pila:
+        nodo = pila.pop()
+        orden.append(nodo)
+        if nodo.izquierda:
+            pila.append(nodo.izquierda)
+        if nodo.derecha:
+            pila.append(nodo.derecha)
+    
+    orden.reverse()
+    return orden
+
+
+def calcular_huellas(raiz):
+    """
+    Calcula en O(n) una huella estructural (tipo Merkle) para cada subárbol.
+    
+    La huella de un nodo combina su valor con las huellas de sus dos hijos,
+    así que dos subárboles iguales tienen siempre la misma huella. Dos huellas
+    iguales pueden venir de subárboles distintos (colisión), por lo que una
+    coincidencia debe confirmarse con son_arboles_iguales.
+    
+    Args:
+        raiz: La raíz del árbol binario.
+        
+    Returns:
+        Un diccionario que asocia cada nodo con la huella de su subárbol.
+    """
+    # El subárbol vacío tiene huella 0
+    huellas = {None: 0}
+    for nodo in _nodos_hijos_primero(raiz):
+        huellas[nodo] = hash((nodo.valor, huellas[nodo.izquierda], huellas[nodo.derecha]))
+    del huellas[None]
+    
+    return huellas
+
+
+def subarboles_comunes(raiz1, raiz2, huellas1=None, huellas2=None):
+    """
+    Encuentra los subárboles máximos que aparecen idénticos en dos árboles.
+    
+    Indexa por huella los subárboles del primer árbol y recorre el segundo de
+    arriba hacia abajo: cuando un subárbol coincide (confirmado comparándolo)
+    se anota y no se desciende más en él. Como los subárboles anotados son
+    disjuntos, el coste total es lineal en el tamaño de ambos árboles.
+    
+    Args:
+        raiz1: La raíz del primer árbol.
+        raiz2: La raíz del segundo árbol.
+        huellas1, huellas2: Huellas ya calculadas de cada árbol, si las hay.
+        
+    Returns:
+        Una lista de pares (nodo del primer árbol, nodo del segundo árbol).
+    """
+    if huellas1 is None:
+        huellas1 = calcular_huellas(raiz1)
+    if huellas2 is None:
+        huellas2 = calcular_huellas(raiz2)
+    
+    # Subárboles del primer árbol agrupados por huella
+    por_huella = {}
+    for nodo, huella in huellas1.items():
+        por_huella.setdefault(huella, []).append(nodo)
+    
+    comunes = []
+    pila = [raiz2] if raiz2 else []
+    while pila:
+        nodo = pila.pop()
+        candidatos = por_huella.get(huellas2[nodo], ())
+        igual = next((candidato for candidato in candidatos
+                      if son_arboles_iguales(candidato, nodo)), None)
+        
+        if igual is not None:
+            comunes.append((igual, nodo))
+            continue
+        
+        if nodo.derecha:
+            pila.append(nodo.derecha)
+        if nodo.izquierda:
+            pila.append(nodo.izquierda)
+    
+    return comunes
+
+
+def serializar_dag(raiz):
+    """
+    Serializa un árbol binario escribiendo una sola vez cada subárbol repetido.
+    
+    Los subárboles se identifican por su estructura (consing de hashes): dos
+    subárboles con el mismo valor y los mismos hijos reciben el mismo número
+    de entrada. Cada entrada se escribe como tres elementos "valor,izquierda,
+    derecha", donde los hijos son números de entradas anteriores o "null". La
+    raíz es la última entrada. Un subárbol que se repite k veces cuesta una
+    entrada más k - 1 referencias.
+    
+    Args:
+        raiz: La raíz del árbol binario.
+        
+    Returns:
+        Una cadena de texto como "[5,null,null,5,0,0]" (tres nodos con valor 5).
+    """
+    entrada_por_estructura = {}
+    entrada_por_nodo = {None: "null"}
+    resultado = []
+    
+    for nodo in _nodos_hijos_primero(raiz):
+        estructura = (nodo.valor, entrada_por_nodo[nodo.izquierda], entrada_por_nodo[nodo.derecha])
+        entrada = entrada_por_estructura.get(estructura)
+        if entrada is None:
+            entrada = str(len(entrada_por_estructura))
+            entrada_por_estructura[estructura] = entrada
+            resultado.extend((str(nodo.valor), estructura[1], estructura[2]))
+        entrada_por_nodo[nodo] = entrada
+    
+    return "[" + ",".join(resultado) + "]"
+
+
+def deserializar_dag(datos, compartir=True):
+    """
+    Reconstruye un árbol binario a partir del formato de serializar_dag.
+    
+    Args:
+        datos: Una cadena de texto generada por serializar_dag.
+        compartir: Si es True, los subárboles repetidos se reconstruyen una sola
+            vez y sus nodos se comparten entre todas las apariciones (modificar
+            uno las modifica todas). Si es False, cada aparición recibe sus
+            propios nodos, como con deserializar.
+        
+    Returns:
+        La raíz del árbol binario reconstruido.
+    """
+    datos = datos.strip("[]")
+    if not datos:
+        return None
+    
+    valores = datos.split(",")
+    entradas = [(int(valores[i]),
+                 None if valores[i + 1] == "null" else int(valores[i + 1]),
+                 None if valores[i + 2] == "null" else int(valores[i + 2]))
+                for i in range(0, len(valores), 3)]
+    
+    if compartir:
+        # Cada entrada solo referencia entradas anteriores, ya construidas
+        nodos = []
+        for valor, izquierda, derecha in entradas:
+            nodo = NodoArbol(valor)
+            if izquierda is not None:
+                nodo.izquierda = nodos[izquierda]
+            if derecha is not None:
+                nodo.derecha = nodos[derecha]
+            nodos.append(nodo)
+        return nodos[-1]
+    
+    # Expande las referencias creando nodos nuevos en cada aparición
+    raiz = NodoArbol(entradas[-1][0])
+    pila = [(raiz, len(entradas) - 1)]
+    while pila:
+        nodo, entrada = pila.pop()
+        _, izquierda, derecha = entradas[entrada]
+        if izquierda is not None:
+            nodo.izquierda = NodoArbol(entradas[izquierda][0])
+            pila.append((nodo.izquierda, izquierda))
+        if derecha is not None:
+            nodo.derecha = NodoArbol(entradas[derecha][0])
+            pila.append((nodo.derecha, derecha))
+    
+    return raiz
+
+
+def calcular_parche(raiz_anterior, raiz_nueva):
+    """
+    Calcula las diferencias entre dos versiones de un árbol binario.
+    
+    Las posiciones se numeran como en un montículo: la raíz es 1 y los hijos
+    de la posición i son 2i (izquierdo) y 2i + 1 (derecho); se escriben en
+    hexadecimal, así que no hay límite de dígitos por profundo que sea el
+    árbol. El parche es una lista de operaciones separadas por ";":
+    
+    - "~posicion:valor": el nodo en la posición cambia de valor.
+    - "-posicion": se elimina el subárbol en la posición.
+    - "+posicion:[...]": se añade en la posición el subárbol serializado.
+    
+    El cálculo recorre todas las posiciones presentes en ambos árboles, O(n).
+    Cada operación ocupa unos profundidad / 4 caracteres de posición más su
+    contenido, así que el parche crece con el número de cambios y con su
+    profundidad, no con el tamaño del árbol.
+    
+    Args:
+        raiz_anterior: La raíz de la versión anterior del árbol.
+        raiz_nueva: La raíz de la versión nueva del árbol.
+        
+    Returns:
+        Una cadena de texto con el parche; vacía si los árboles son iguales.
+    """
+    def posicion(camino):
+        """Convierte un camino enlazado (padre, paso) en su posición en hexadecimal."""
+        # El camino solo se recorre al emitir una operación, no en cada nodo visitado
+        pasos = []
+        while camino is not None:
+            camino, paso = camino
+            pasos.append(paso)
+        pasos.append("1")
+        return f"{int(''.join(reversed(pasos)), 2):x}"
+    
+    operaciones = []
+    pila = [(raiz_anterior, raiz_nueva, None)]
+    
+    while pila:
+        anterior, nuevo, camino = pila.pop()
+        
+        if anterior is None and nuevo is None:
+            continue
+        if nuevo is None:
+            operaciones.append(f"-{posicion(camino)}")
+            continue
+        if anterior is None:
+            operaciones.append(f"+{posicion(camino)}:{serializar(nuevo)}")
+            continue
+        
+        if anterior.valor != nuevo.valor:
+            operaciones.append(f"~{posicion(camino)}:{nuevo.valor}")
+        
+        pila.append((anterior.derecha, nuevo.derecha, (camino, "1")))
+        pila.append((anterior.izquierda, nuevo.izquierda, (camino, "0")))
+    
+    return ";".join(operaciones)
+
+
+def aplicar_parche(raiz, parche):
+    """
+    Aplica un parche generado por calcular_parche sobre un árbol binario.
+    
+    El árbol se modifica en su lugar; si pertenece a un ArbolBinario, es
+    mejor usar ArbolBinario.aplicar_parche, que además descarta sus huellas.
+    
+    Args:
+        raiz: La raíz de la versión anterior del árbol.
+        parche: Una cadena de texto generada por calcular_parche.
+        
+    Returns:
+        La raíz de la versión nueva (cambia si el parche afecta a la raíz).
+    """
+    if not parche:
+        return raiz
+    
+    for operacion in parche.split(";"):
+        tipo = operacion[0]
+        posicion, _, argumento = operacion[1:].partition(":")
+        # Los bits de la posición tras el 1 inicial describen el camino
+        camino = bin(int(posicion, 16))[3:]
+        
+        if tipo == "~":
+            nodo = raiz
+            for paso in camino:
+                nodo = nodo.derecha if paso == "1" else nodo.izquierda
+            nodo.valor = int(argumento)
+            continue
+        
+        subarbol = deserializar(argumento) if tipo == "+" else None
+        if not camino:
+            raiz = subarbol
+            continue
+        
+        padre = raiz
+        for paso in camino[:-1]:
+            padre = padre.derecha if paso == "1" else padre.izquierda
+        if camino[-1] == "1":
+            padre.derecha = subarbol
+        else:
+            padre.izquierda = subarbol
+    
+    return raiz
+
+
+def _contexto_procesos():
+    """Devuelve el contexto fork si existe (los procesos heredan el árbol sin copiarlo), o None."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _iniciar_trabajador(fragmentos):
+    """Guarda en el proceso los subárboles heredados del proceso principal."""
+    global _fragmentos_trabajador
+    _fragmentos_trabajador = fragmentos
+
+
+def _serializar_fragmento(indice):
+    """Serializa en un proceso el subárbol heredado que ocupa la posición indice."""
+    return serializar(_fragmentos_trabajador[indice])
+
+
+def _decodificar_fragmento(fragmento):
+    """Convierte un fragmento en su mapa de presencia y sus valores."""
+    fragmento = fragmento.strip("[]")
+    if not fragmento:
+        return b"", []
+    
+    elementos = fragmento.split(",")
+    presencia = bytes([elemento != "null" for elemento in elementos])
+    valores = [int(elemento) for elemento in elementos if elemento != "null"]
+    return presencia, valores
+
+
+def _niveles_completos(elementos):
+    """
+    Divide los elementos de serializar en niveles, reponiendo los "null"
+    finales que serializar elimina.
+    """
+    niveles = []
+    inicio = 0
+    tamano = 1 if elementos else 0
+    
+    while tamano:
+        nivel = elementos[inicio:inicio + tamano]
+        nivel += ["null"] * (tamano - len(nivel))
+        niveles.append(nivel)
+        inicio += tamano
+        tamano = 2 * (tamano - nivel.count("null"))
+    
+    return niveles
+
+
+def _leer_contenedor(contenedor):
+    """Separa un contenedor en sus elementos superiores y sus fragmentos."""
+    superior, longitudes, datos = contenedor.split("|", 2)
+    superior = superior.strip("[]")
+    
+    fragmentos = []
+    inicio = 0
+    for longitud in map(int, longitudes.split(",")):
+        fragmentos.append(datos[inicio:inicio + longitud])
+        inicio += longitud
+    
+    return superior.split(",") if superior else [], fragmentos
+
+
+def serializar_paralelo(raiz, procesos=None, nivel_frontera=None):
+    """
+    Serializa un árbol binario repartiendo sus subárboles entre procesos.
+    
+    El árbol se corta en un nivel frontera: los niveles superiores se
+    escriben directamente y cada posición del nivel frontera se serializa
+    como un fragmento independiente en un ProcessPoolExecutor. El resultado
+    es un contenedor "superior|longitudes|fragmentos", donde superior son los
+    niveles anteriores a la frontera en formato de serializar (sin recortar)
+    y longitudes es el índice de los fragmentos, que van concatenados.
+    
+    Los procesos reciben los subárboles heredándolos con fork. Donde fork no
+    existe (Windows, y macOS por defecto) habría que copiarlos con pickle a
+    cada proceso, lo que cuesta tanto como serializarlos y falla por
+    recursión en árboles profundos; en ese caso los fragmentos se serializan
+    en el proceso actual, con el mismo contenedor como resultado.
+    
+    Args:
+        raiz: La raíz del árbol binario.
+        procesos: Número de procesos; por defecto, uno por CPU.
+        nivel_frontera: Profundidad del corte. Por defecto se usa el primer
+            nivel con al menos cuatro posiciones por proceso.
+        
+    Returns:
+        Una cadena de texto con el contenedor.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    objetivo = _FRAGMENTOS_POR_PROCESO * procesos
+    
+    superior = []
+    frontera = [raiz]
+    profundidad = 0
+    
+    while any(frontera):
+        if nivel_frontera is None:
+            if len(frontera) >= objetivo:
+                break
+        elif profundidad >= nivel_frontera:
+            break
+        
+        siguiente = []
+        for nodo in frontera:
+            if nodo:
+                superior.append(str(nodo.valor))
+                siguiente.append(nodo.izquierda)
+                siguiente.append(nodo.derecha)
+            else:
+                superior.append("null")
+        frontera = siguiente
+        profundidad += 1
+    
+    contexto = _contexto_procesos()
+    if contexto is None or procesos == 1:
+        fragmentos = [serializar(nodo) for nodo in frontera]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto,
+                                 initializer=_iniciar_trabajador, initargs=(frontera,)) as ejecutor:
+            tamano_lote = max(1, len(frontera) // (_FRAGMENTOS_POR_PROCESO * procesos))
+            fragmentos = list(ejecutor.map(_serializar_fragmento, range(len(frontera)), chunksize=tamano_lote))
+    
+    longitudes = ",".join(str(len(fragmento)) for fragmento in fragmentos)
+    return "[" + ",".join(superior) + "]|" + longitudes + "|" + "".join(fragmentos)
+
+
+def ensamblar_contenedor(contenedor):
+    """
+    Convierte un contenedor de serializar_paralelo al formato de serializar.
+    
+    Args:
+        contenedor: Una cadena de texto generada por serializar_paralelo.
+        
+    Returns:
+        La misma cadena que devolvería serializar sobre el árbol original.
+    """
+    resultado, fragmentos = _leer_contenedor(contenedor)
+    niveles = [_niveles_completos(fragmento.strip("[]").split(",") if fragmento != "[]" else [])
+               for fragmento in fragmentos]
+    
+    # El nivel k de cada fragmento forma parte del nivel frontera + k
+    profundidad = 0
+    while any(len(niveles_fragmento) > profundidad for niveles_fragmento in niveles):
+        for niveles_fragmento in niveles:
+            if len(niveles_fragmento) > profundidad:
+                resultado.extend(niveles_fragmento[profundidad])
+            elif profundidad == 0:
+                resultado.append("null")
+        profundidad += 1
+    
+    # Eliminar los "null" al final
+    while resultado and resultado[-1] == "null":
+        resultado.pop()
+    
+    return "[" + ",".join(resultado) + "]"
+
+
+def deserializar_paralelo(contenedor, procesos=None):
+    """
+    Reconstruye un árbol binario a partir de un contenedor de serializar_paralelo.
+    
+    Los procesos decodifican los fragmentos (separar y convertir los valores);
+    los nodos se crean en el proceso principal, porque un árbol de NodoArbol
+    no se puede compartir entre procesos sin volver a copiarlo.
+    
+    Args:
+        contenedor: Una cadena de texto generada por serializar_paralelo.
+        procesos: Número de procesos; por defecto, uno por CPU.
+        
+    Returns:
+        La raíz del árbol binario reconstruido.
+    """
+    superior, fragmentos = _leer_contenedor(contenedor)
+    
+    with ProcessPoolExecutor(max_workers=procesos, mp_context=_contexto_procesos()) as ejecutor:
+        tamano_lote = max(1, len(fragmentos) // (_FRAGMENTOS_POR_PROCESO * (procesos or os.cpu_count() or 1)))
+        decodificados = list(ejecutor.map(_decodificar_fragmento, fragmentos, chunksize=tamano_lote))
+    
+    subarboles = []
+    for presencia, valores in decodificados:
+        if not presencia:
+            subarboles.append(None)
+            continue
+        
+        valores = iter(valores)
+        subarbol = NodoArbol(next(valores))
+        cola = deque([subarbol])
+        i = 1
+        while cola and i < len(presencia):
+            nodo_actual = cola.popleft()
+            if presencia[i]:
+                nodo_actual.izquierda = NodoArbol(next(valores))
+                cola.append(nodo_actual.izquierda)
+            i += 1
+            if i < len(presencia) and presencia[i]:
+                nodo_actual.derecha = NodoArbol(next(valores))
+                cola.append(nodo_actual.derecha)
+            i += 1
+        subarboles.append(subarbol)
+    
+    if not superior:
+        return subarboles[0]
+    
+    # Los nodos del último nivel superior reciben los fragmentos por parejas
+    raiz = None
+    nivel = []
+    consumidos = 0
+    for elementos in _niveles_completos(superior):
+        # superior no está recortado: no hay niveles más allá de sus elementos
+        if consumidos == len(superior):
+            break
+        consumidos += len(elementos)
+        
+        padres = iter(nivel)
+        nivel = []
+        for i, elemento in enumerate(elementos):
+            nodo = NodoArbol(int(elemento)) if elemento != "null" else None
+            if nodo:
+                nivel.append(nodo)
+            if raiz is None:
+                raiz = nodo
+            elif i % 2 == 0:
+                padre = next(padres)
+                padre.izquierda = nodo
+            else:
+                padre.derecha = nodo
+    
+    for i, padre in enumerate(nivel):
+        padre.izquierda = subarboles[2 * i]
+        padre.derecha = subarboles[2 * i + 1]
+    
+    return raiz
+
+
 # Pruebas para las funciones de serialización y deserialización
 def probar_serializar_deserializar():
     """Prueba las funciones serializar y deserializar."""
@@ -255,6 +1449,100 @@ def probar_serializar_deserializar():
     arbol_deserializado5.imprimir_estructura()
     
     print(f"¿Son iguales? {son_arboles_iguales(arbol5.raiz, deserializado5)}")
+    
+    # Caso de prueba 6: Formato binario compacto
+    print("\n--- Caso de prueba 6: Formato binario compacto ---")
+    binario6 = serializar_binario(arbol1.raiz)
+    print(f"Serializado: {binario6.hex()} ({len(binario6)} bytes)")
+    
+    deserializado6 = deserializar_binario(binario6)
+    print(f"¿Son iguales? {son_arboles_iguales(arbol1.raiz, deserializado6)}")
+    
+    # Caso de prueba 7: Serialización por bloques sobre un flujo
+    print("\n--- Caso de prueba 7: Serialización por bloques sobre un flujo ---")
+    flujo7 = io.StringIO()
+    serializar_a(flujo7, arbol4.raiz, valores_por_bloque=2)
+    print(f"Serializado: {flujo7.getvalue()}")
+    
+    flujo7.seek(0)
+    deserializado7 = deserializar_de(flujo7, caracteres_por_bloque=3)
+    print(f"¿Son iguales? {son_arboles_iguales(arbol4.raiz, deserializado7)}")
+    
+    # Caso de prueba 8: Deserialización vectorizada con NumPy
+    if np is not None:
+        print("\n--- Caso de prueba 8: Deserialización vectorizada con NumPy ---")
+        valores8, izquierdas8, derechas8 = deserializar_enteros(serializado1, como_arreglos=True)
+        print(f"Valores: {valores8.tolist()}")
+        print(f"Hijos izquierdos: {izquierdas8.tolist()}")
+        print(f"Hijos derechos: {derechas8.tolist()}")
+        print(f"¿Son iguales? {son_arboles_iguales(arbol1.raiz, deserializar_enteros(serializado1))}")
+    
+    # Caso de prueba 9: Vista perezosa sobre el formato binario
+    print("\n--- Caso de prueba 9: Vista perezosa sobre el formato binario ---")
+    vista9 = VistaArbolBinario(binario6)
+    print(f"Raíz: {vista9.raiz.valor}, hijos: {vista9.raiz.izquierda.valor} y {vista9.raiz.derecha.valor}")
+    print(f"¿Son iguales? {son_arboles_iguales(arbol1.raiz, vista9.raiz)}")
+    
+    # Caso de prueba 10: Comparación con huellas de subárboles
+    print("\n--- Caso de prueba 10: Comparación con huellas de subárboles ---")
+    arbol10 = ArbolBinario()
+    arbol10.construir_arbol_desde_lista([7, 2, 3, 4, 5, None, 6])
+    
+    print(f"¿Son iguales? {arbol1.es_igual(arbol10)}")
+    comunes10 = subarboles_comunes(arbol1.raiz, arbol10.raiz, arbol1.huellas(), arbol10.huellas())
+    print(f"Subárboles comunes (raíces): {[nodo.valor for nodo, _ in comunes10]}")
+    
+    # Caso de prueba 11: Serialización sin subárboles repetidos
+    print("\n--- Caso de prueba 11: Serialización sin subárboles repetidos ---")
+    arbol11 = ArbolBinario()
+    arbol11.construir_arbol_desde_lista([5, 5, 5, 5, 5, 5, 5])
+    
+    print(f"Serializado por niveles: {serializar(arbol11.raiz)}")
+    serializado11 = serializar_dag(arbol11.raiz)
+    print(f"Serializado sin repetidos: {serializado11}")
+    
+    print(f"¿Son iguales (compartido)? {son_arboles_iguales(arbol11.raiz, deserializar_dag(serializado11))}")
+    print(f"¿Son iguales (expandido)? {son_arboles_iguales(arbol11.raiz, deserializar_dag(serializado11, compartir=False))}")
+    
+    # Caso de prueba 12: Parche entre dos versiones de un árbol
+    print("\n--- Caso de prueba 12: Parche entre dos versiones de un árbol ---")
+    anterior12 = deserializar("[1,2,3,null,null,4,5]")
+    nuevo12 = deserializar("[1,2,7,6,null,4]")
+    
+    parche12 = calcular_parche(anterior12, nuevo12)
+    print(f"Parche: {parche12}")
+    
+    raiz12 = aplicar_parche(anterior12, parche12)
+    print(f"Árbol parcheado: {serializar(raiz12)}")
+    print(f"¿Coincide con la versión nueva? {son_arboles_iguales(raiz12, nuevo12)}")
+    
+    # Caso de prueba 13: Codecs de valores
+    print("\n--- Caso de prueba 13: Codecs de valores ---")
+    raiz13 = NodoArbol("a,b")
+    raiz13.izquierda = NodoArbol("[x]")
+    raiz13.derecha = NodoArbol("ñ|:")
+    
+    serializado13 = serializar(raiz13, codec=CodecTexto())
+    print(f"Texto: {serializado13}")
+    print(f"¿Son iguales? {son_arboles_iguales(raiz13, deserializar(serializado13, codec=CodecTexto()))}")
+    
+    codec_tupla13 = CodecTupla(CodecEntero(), CodecFlotante(), CodecTexto())
+    raiz13 = NodoArbol((1, 0.5, "uno"))
+    raiz13.derecha = NodoArbol((2, -1.25, "dos, tres"))
+    
+    serializado13 = serializar(raiz13, codec=codec_tupla13)
+    print(f"Tuplas: {serializado13}")
+    print(f"¿Son iguales? {son_arboles_iguales(raiz13, deserializar(serializado13, codec=codec_tupla13))}")
+    
+    # Caso de prueba 14: Serialización en paralelo
+    print("\n--- Caso de prueba 14: Serialización en paralelo ---")
+    arbol14 = ArbolBinario()
+    arbol14.construir_arbol_desde_lista(list(range(1, 16)))
+    
+    contenedor14 = serializar_paralelo(arbol14.raiz, procesos=2, nivel_frontera=2)
+    print(f"Contenedor: {contenedor14}")
+    print(f"¿Igual a la secuencial? {ensamblar_contenedor(contenedor14) == serializar(arbol14.raiz)}")
+    print(f"¿Son iguales? {son_arboles_iguales(arbol14.raiz, deserializar_paralelo(contenedor14, procesos=2))}")
 
 # Ejecutar las pruebas
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+from array import array
 from collections import deque
 
 class NodoArbol:
@@ -9,8 +10,18 @@ class NodoArbol:
 
 class ArbolBinario:
     """Clase para representar un árbol binario."""
-    def __init__(self):
+    def __init__(self, indexar=False):
+        """
+        Args:
+            indexar: Si es True, mantiene un índice de valor a nodos y de nodo a
+                padre, con el que contiene, buscar y ancestro_comun no recorren
+                el árbol. El índice solo se actualiza con los métodos de la
+                clase, no al modificar los nodos directamente.
+        """
         self.raiz = None
+        self._nodos_por_valor = {} if indexar else None
+        self._padres = {} if indexar else None
+        self._valores_desordenados = set()
     
     def construir_arbol_desde_lista(self, lista):
         """Construye un árbol binario a partir de una lista de valores en orden de nivel."""
@@ -35,6 +46,239 @@ class ArbolBinario:
                 nodo_actual.derecha = NodoArbol(lista[i])
                 cola.append(nodo_actual.derecha)
             i += 1
+        
+        if self._nodos_por_valor is not None:
+            self._indexar()
+    
+    def _indexar(self):
+        """Reconstruye el índice recorriendo el árbol por niveles."""
+        self._nodos_por_valor.clear()
+        self._padres.clear()
+        self._valores_desordenados.clear()
+        
+        cola = deque([(self.raiz, None)] if self.raiz else [])
+        while cola:
+            nodo, padre = cola.popleft()
+            self._registrar(nodo, padre)
+            if nodo.izquierda:
+                cola.append((nodo.izquierda, nodo))
+            if nodo.derecha:
+                cola.append((nodo.derecha, nodo))
+    
+    def _registrar(self, nodo, padre):
+        """
+        Añade un nodo al índice.
+        
+        Los nodos de cada valor se guardan en un diccionario (ordenado por
+        inserción y con borrado en O(1)) usado como conjunto ordenado.
+        
+        Args:
+            nodo: El nodo que se añade.
+            padre: El padre del nodo, o None si es la raíz.
+        """
+        self._nodos_por_valor.setdefault(nodo.valor, {})[nodo] = None
+        self._padres[nodo] = padre
+    
+    def _clave_nivel(self, nodo):
+        """Clave que ordena los nodos indexados como un recorrido por niveles."""
+        camino = []
+        padre = self._padres[nodo]
+        while padre is not None:
+            camino.append(padre.derecha is nodo)
+            nodo, padre = padre, self._padres[padre]
+        camino.reverse()
+        return len(camino), camino
+    
+    def agregar_hijo(self, padre, valor, izquierda=True):
+        """
+        Agrega un nodo hoja al árbol.
+        
+        Args:
+            padre: El nodo al que se agrega el hijo, o None para crear la raíz.
+            valor: El valor del nuevo nodo.
+            izquierda: True para agregarlo como hijo izquierdo, False como derecho.
+            
+        Returns:
+            El nodo creado.
+        """
+        nodo = NodoArbol(valor)
+        if padre is None:
+            if self.raiz is not None:
+                raise ValueError("El árbol ya tiene raíz")
+            self.raiz = nodo
+        elif izquierda:
+            if padre.izquierda is not None:
+                raise ValueError("El nodo ya tiene hijo izquierdo")
+            padre.izquierda = nodo
+        else:
+            if padre.derecha is not None:
+                raise ValueError("El nodo ya tiene hijo derecho")
+            padre.derecha = nodo
+        
+        if self._nodos_por_valor is not None:
+            # Un valor repetido puede quedar antes, en orden de nivel, que los
+            # ya registrados; buscar reordena sus nodos la próxima vez
+            if valor in self._nodos_por_valor:
+                self._valores_desordenados.add(valor)
+            self._registrar(nodo, padre)
+        return nodo
+    
+    def eliminar_subarbol(self, nodo):
+        """
+        Elimina un nodo y todos sus descendientes del árbol.
+        
+        Args:
+            nodo: La raíz del subárbol que se elimina.
+            
+        Raises:
+            ValueError: Si el nodo no pertenece al árbol.
+        """
+        if self._padres is not None:
+            if nodo not in self._padres:
+                raise ValueError("El nodo no está en el árbol")
+            padre = self._padres[nodo]
+        elif nodo is not None and nodo is self.raiz:
+            padre = None
+        else:
+            padre = self._buscar_padre(nodo)
+            if padre is None:
+                raise ValueError("El nodo no está en el árbol")
+        
+        if padre is None:
+            self.raiz = None
+        elif padre.izquierda is nodo:
+            padre.izquierda = None
+        else:
+            padre.derecha = None
+        
+        if self._nodos_por_valor is None:
+            return
+        
+        pila = [nodo]
+        while pila:
+            actual = pila.pop()
+            nodos = self._nodos_por_valor[actual.valor]
+            nodos.pop(actual)
+            if not nodos:
+                del self._nodos_por_valor[actual.valor]
+                self._valores_desordenados.discard(actual.valor)
+            del self._padres[actual]
+            if actual.izquierda:
+                pila.append(actual.izquierda)
+            if actual.derecha:
+                pila.append(actual.derecha)
+    
+    def _buscar_padre(self, nodo):
+        """Busca el padre de un nodo recorriendo el árbol (sin índice); None si no lo encuentra."""
+        pila = [self.raiz] if self.raiz and nodo else []
+        while pila:
+            actual = pila.pop()
+            if actual.izquierda is nodo or actual.derecha is nodo:
+                return actual
+            if actual.izquierda:
+                pila.append(actual.izquierda)
+            if actual.derecha:
+                pila.append(actual.derecha)
+        return None
+    
+    def buscar(self, valor):
+        """
+        Busca un nodo por su valor.
+        
+        Args:
+            valor: El valor a buscar.
+            
+        Returns:
+            El primer nodo con ese valor en orden de nivel, o None si no existe.
+            Con índice y valores repetidos, el resultado es el mismo que sin él.
+        """
+        if self._nodos_por_valor is not None:
+            nodos = self._nodos_por_valor.get(valor)
+            if not nodos:
+                return None
+            if valor in self._valores_desordenados:
+                self._valores_desordenados.discard(valor)
+                nodos = dict.fromkeys(sorted(nodos, key=self._clave_nivel))
+                self._nodos_por_valor[valor] = nodos
+            return next(iter(nodos))
+        
+        cola = deque([self.raiz] if self.raiz else [])
+        while cola:
+            nodo = cola.popleft()
+            if nodo.valor == valor:
+                return nodo
+            if nodo.izquierda:
+                cola.append(nodo.izquierda)
+            if nodo.derecha:
+                cola.append(nodo.derecha)
+        return None
+    
+    def contiene(self, valor):
+        """Indica si algún nodo tiene el valor dado (O(1) con índice)."""
+        if self._nodos_por_valor is not None:
+            return valor in self._nodos_por_valor
+        return existe_nodo(self.raiz, valor)
+    
+    def ancestro_comun(self, p, q):
+        """
+        Encuentra el ancestro común más cercano de dos valores.
+        
+        Si un valor está repetido se usa su primer nodo en orden de nivel, el
+        mismo que devuelve buscar. Con índice sube desde los dos nodos por los
+        punteros al padre, en O(profundidad); sin índice recorre el árbol por
+        niveles hasta encontrar los dos nodos.
+        
+        Args:
+            p: El valor del primer nodo.
+            q: El valor del segundo nodo.
+            
+        Returns:
+            El valor del ancestro común más cercano, o None si alguno de los
+            valores no está en el árbol.
+        """
+        if self._padres is not None:
+            nodo_p, nodo_q, padres = self.buscar(p), self.buscar(q), self._padres
+        else:
+            nodo_p, nodo_q, padres = self._buscar_con_padres(p, q)
+        if nodo_p is None or nodo_q is None:
+            return None
+        
+        ancestros = set()
+        while nodo_p is not None:
+            ancestros.add(nodo_p)
+            nodo_p = padres[nodo_p]
+        while nodo_q not in ancestros:
+            nodo_q = padres[nodo_q]
+        return nodo_q.valor
+    
+    def _buscar_con_padres(self, p, q):
+        """
+        Busca por niveles el primer nodo de cada valor (sin índice).
+        
+        Args:
+            p: El valor del primer nodo.
+            q: El valor del segundo nodo.
+            
+        Returns:
+            Una tupla (nodo_p, nodo_q, padres), donde padres asigna su padre a
+            cada nodo visitado y los nodos no encontrados son None.
+        """
+        nodo_p = nodo_q = None
+        padres = {self.raiz: None}
+        cola = deque([self.raiz] if self.raiz else [])
+        while cola:
+            nodo = cola.popleft()
+            if nodo_p is None and nodo.valor == p:
+                nodo_p = nodo
+            if nodo_q is None and nodo.valor == q:
+                nodo_q = nodo
+            if nodo_p is not None and nodo_q is not None:
+                break
+            for hijo in (nodo.izquierda, nodo.derecha):
+                if hijo:
+                    padres[hijo] = nodo
+                    cola.append(hijo)
+        return nodo_p, nodo_q, padres
     
     def imprimir_estructura(self):
         """Imprime la estructura del árbol en forma visual."""
@@ -58,14 +302,22 @@ def ancestro_comun_mas_cercano(raiz, p, q):
     """
     Encuentra el ancestro común más cercano (LCA) de dos nodos en un árbol binario.
     
+    Si raiz es un árbol con su propio método ancestro_comun(p, q), como el
+    ArbolBinarioBusqueda de ejercisio1.py (que solo recorre el camino desde la
+    raíz, en O(altura)) o un ArbolBinario indexado, se delega en él.
+    
     Args:
-        raiz: La raíz del árbol binario.
+        raiz: La raíz del árbol binario, o un árbol con método ancestro_comun.
         p: El valor del primer nodo.
         q: El valor del segundo nodo.
         
     Returns:
         El valor del nodo que es el ancestro común más cercano, o None si no existe.
     """
+    ancestro_comun = getattr(raiz, "ancestro_comun", None)
+    if ancestro_comun is not None:
+        return ancestro_comun(p, q)
+    
     resultado = _buscar_ancestro(raiz, p, q)
     return resultado.valor if resultado else None
 
@@ -121,6 +373,307 @@ def existe_nodo(raiz, valor):
     return existe_nodo(raiz.izquierda, valor) or existe_nodo(raiz.derecha, valor)
 
 
+class IndiceAncestros:
+    """
+    Índice para responder consultas de ancestro común más cercano en O(1).
+    
+    Se construye una vez en O(n log n) a partir de la raíz: guarda el recorrido
+    de Euler del árbol (cada nodo aparece al entrar y tras volver de cada
+    hijo), la primera aparición de cada valor en él y una tabla dispersa con
+    el nodo de menor profundidad en cada tramo de longitud potencia de 2. El
+    LCA de p y q es el nodo menos profundo entre sus primeras apariciones.
+    
+    El árbol no debe modificarse después de construir el índice. Si hay
+    valores repetidos, se usa la primera aparición en preorden.
+    """
+    def __init__(self, raiz):
+        """
+        Args:
+            raiz: La raíz del árbol binario.
+        """
+        self._nodos = []
+        self._profundidades = array("q")
+        self._primera_aparicion = {}
+        euler = array("q")
+        
+        # Las marcas (None, id) vuelven a anotar un nodo al terminar un hijo
+        pila = [(raiz, 0)] if raiz else []
+        while pila:
+            nodo, dato = pila.pop()
+            if nodo is None:
+                euler.append(dato)
+                continue
+            
+            id_nodo = len(self._nodos)
+            self._nodos.append(nodo)
+            self._profundidades.append(dato)
+            self._primera_aparicion.setdefault(nodo.valor, len(euler))
+            euler.append(id_nodo)
+            
+            for hijo in (nodo.derecha, nodo.izquierda):
+                if hijo:
+                    pila.append((None, id_nodo))
+                    pila.append((hijo, dato + 1))
+        
+        # tabla[k][i] es el nodo menos profundo de euler[i:i + 2**k]
+        profundidades = self._profundidades
+        self._tabla = [euler]
+        paso = 1
+        while 2 * paso <= len(euler):
+            anterior = self._tabla[-1]
+            self._tabla.append(array("q", [a if profundidades[a] <= profundidades[b] else b
+                                           for a, b in zip(anterior, anterior[paso:])]))
+            paso *= 2
+    
+    def __contains__(self, valor):
+        """Indica si algún nodo del árbol indexado tiene el valor dado."""
+        return valor in self._primera_aparicion
+    
+    def lca(self, p, q):
+        """
+        Encuentra el ancestro común más cercano de dos valores en O(1).
+        
+        Args:
+            p: El valor del primer nodo.
+            q: El valor del segundo nodo.
+            
+        Returns:
+            El valor del ancestro común más cercano, o None si alguno de los
+            valores no está en el árbol.
+        """
+        inicio = self._primera_aparicion.get(p)
+        fin = self._primera_aparicion.get(q)
+        if inicio is None or fin is None:
+            return None
+        if inicio > fin:
+            inicio, fin = fin, inicio
+        
+        # Dos tramos de longitud potencia de 2 que cubren [inicio, fin]
+        k = (fin - inicio + 1).bit_length() - 1
+        fila = self._tabla[k]
+        a = fila[inicio]
+        b = fila[fin - (1 << k) + 1]
+        return self._nodos[a if self._profundidades[a] <= self._profundidades[b] else b].valor
+
+
+class TablaAncestros:
+    """
+    Tabla de saltos binarios para consultas de ancestros en O(log n).
+    
+    Los nodos se numeran en preorden. Para cada nodo se guarda su profundidad
+    y, por cada j, su ancestro 2**j niveles más arriba (-1 si no existe), todo
+    en arreglos de enteros: n·log n enteros en total. Subir k niveles combina
+    los saltos de los bits de k.
+    
+    El árbol no debe modificarse después de construir la tabla. Si hay
+    valores repetidos, se usa la primera aparición en preorden.
+    """
+    def __init__(self, raiz):
+        """
+        Args:
+            raiz: La raíz del árbol binario.
+        """
+        self._valores = []
+        self._ids = {}
+        self._profundidades = array("q")
+        padres = array("q")
+        
+        pila = [(raiz, -1)] if raiz else []
+        while pila:
+            nodo, id_padre = pila.pop()
+            id_nodo = len(self._valores)
+            self._valores.append(nodo.valor)
+            self._ids.setdefault(nodo.valor, id_nodo)
+            padres.append(id_padre)
+            self._profundidades.append(self._profundidades[id_padre] + 1 if id_padre >= 0 else 0)
+            
+            for hijo in (nodo.derecha, nodo.izquierda):
+                if hijo:
+                    pila.append((hijo, id_nodo))
+        
+        # saltos[j][i] es el ancestro 2**j niveles por encima del nodo i
+        self._saltos = [padres]
+        profundidad_maxima = max(self._profundidades, default=0)
+        for _ in range(1, max(profundidad_maxima.bit_length(), 1)):
+            anterior = self._saltos[-1]
+            self._saltos.append(array("q", [anterior[a] if a >= 0 else -1 for a in anterior]))
+    
+    def __contains__(self, valor):
+        """Indica si algún nodo de la tabla tiene el valor dado."""
+        return valor in self._ids
+    
+    def _subir(self, id_nodo, k):
+        """Devuelve el id del ancestro k niveles por encima, o -1."""
+        if k > self._profundidades[id_nodo]:
+            return -1
+        j = 0
+        while k:
+            if k & 1:
+                id_nodo = self._saltos[j][id_nodo]
+            k >>= 1
+            j += 1
+        return id_nodo
+    
+    def _lca(self, a, b):
+        """Devuelve el id del ancestro común más cercano de dos ids."""
+        if self._profundidades[a] < self._profundidades[b]:
+            a, b = b, a
+        a = self._subir(a, self._profundidades[a] - self._profundidades[b])
+        if a == b:
+            return a
+        
+        # Subir ambos mientras sus ancestros sigan siendo distintos
+        for saltos in reversed(self._saltos):
+            if saltos[a] != saltos[b]:
+                a = saltos[a]
+                b = saltos[b]
+        return self._saltos[0][a]
+    
+    def ancestro_k(self, x, k):
+        """
+        Encuentra el ancestro que está k niveles por encima de un nodo.
+        
+        Args:
+            x: El valor del nodo.
+            k: El número de niveles que hay que subir (0 devuelve x).
+            
+        Returns:
+            El valor del ancestro, o None si x no está en el árbol o no tiene
+            k niveles por encima.
+        """
+        id_nodo = self._ids.get(x)
+        if id_nodo is None or k < 0:
+            return None
+        id_nodo = self._subir(id_nodo, k)
+        return self._valores[id_nodo] if id_nodo >= 0 else None
+    
+    def profundidad(self, x):
+        """
+        Args:
+            x: El valor del nodo.
+            
+        Returns:
+            La profundidad del nodo (0 para la raíz), o None si no está en el árbol.
+        """
+        id_nodo = self._ids.get(x)
+        return self._profundidades[id_nodo] if id_nodo is not None else None
+    
+    def distancia(self, x, y):
+        """
+        Calcula la longitud (en aristas) del camino entre dos nodos.
+        
+        Args:
+            x: El valor del primer nodo.
+            y: El valor del segundo nodo.
+            
+        Returns:
+            La cantidad de aristas entre x e y, o None si alguno no está en el árbol.
+        """
+        a = self._ids.get(x)
+        b = self._ids.get(y)
+        if a is None or b is None:
+            return None
+        profundidades = self._profundidades
+        return profundidades[a] + profundidades[b] - 2 * profundidades[self._lca(a, b)]
+    
+    def lca(self, p, q):
+        """
+        Encuentra el ancestro común más cercano de dos valores en O(log n).
+        
+        Args:
+            p: El valor del primer nodo.
+            q: El valor del segundo nodo.
+            
+        Returns:
+            El valor del ancestro común más cercano, o None si alguno de los
+            valores no está en el árbol.
+        """
+        a = self._ids.get(p)
+        b = self._ids.get(q)
+        if a is None or b is None:
+            return None
+        return self._valores[self._lca(a, b)]
+
+
+def ancestro_comun_mas_cercano_lote(raiz, pares):
+    """
+    Encuentra el ancestro común más cercano de muchos pares en un solo recorrido.
+    
+    Usa el algoritmo fuera de línea de Tarjan: al entrar en un nodo u, cada
+    consulta (u, v) con v ya visitado se responde con el ancestro del conjunto
+    de v en una estructura de conjuntos disjuntos (unión-búsqueda con
+    compresión de caminos). Al terminar un hijo, su conjunto se une al del
+    padre (unión por tamaño). El coste total es O(n + q·α(n)) y no se guarda
+    ningún índice.
+    
+    Args:
+        raiz: La raíz del árbol binario.
+        pares: Lista de pares (p, q) de valores.
+        
+    Returns:
+        Una lista con el valor del ancestro común más cercano de cada par, en
+        el mismo orden que pares, o None si alguno de sus valores no está en
+        el árbol. Con valores repetidos se usa la primera aparición en preorden.
+    """
+    resultados = [None] * len(pares)
+    consultas = {}
+    for i, (p, q) in enumerate(pares):
+        consultas.setdefault(p, []).append((i, q))
+        if q != p:
+            consultas.setdefault(q, []).append((i, p))
+    
+    valores = []
+    padres = []
+    tamanos = []
+    # ancestros[r] es el nodo del camino actual que representa al conjunto de raíz r
+    ancestros = []
+    visitados = {}
+    
+    def buscar(x):
+        """Devuelve el representante del conjunto de x."""
+        # Compresión por mitades: cada nodo del camino salta a su abuelo
+        while padres[x] != x:
+            padres[x] = padres[padres[x]]
+            x = padres[x]
+        return x
+    
+    # Las marcas (None, id_hijo, id_padre) unen un subárbol terminado a su padre
+    pila = [(raiz, None, None)] if raiz else []
+    while pila:
+        nodo, id_hijo, id_padre = pila.pop()
+        if nodo is None:
+            # Unión por tamaño: el conjunto menor cuelga del mayor
+            raiz_hijo = buscar(id_hijo)
+            raiz_padre = buscar(id_padre)
+            if tamanos[raiz_hijo] > tamanos[raiz_padre]:
+                raiz_hijo, raiz_padre = raiz_padre, raiz_hijo
+            padres[raiz_hijo] = raiz_padre
+            tamanos[raiz_padre] += tamanos[raiz_hijo]
+            ancestros[raiz_padre] = id_padre
+            continue
+        
+        id_nodo = len(valores)
+        valores.append(nodo.valor)
+        padres.append(id_nodo)
+        tamanos.append(1)
+        ancestros.append(id_nodo)
+        
+        if nodo.valor not in visitados:
+            visitados[nodo.valor] = id_nodo
+            for i, otro in consultas.get(nodo.valor, ()):
+                if otro in visitados:
+                    resultados[i] = valores[ancestros[buscar(visitados[otro])]]
+        
+        # La marca se saca de la pila cuando ya se ha recorrido todo el subárbol
+        if id_padre is not None:
+            pila.append((None, id_nodo, id_padre))
+        for hijo in (nodo.derecha, nodo.izquierda):
+            if hijo:
+                pila.append((hijo, None, id_nodo))
+    
+    return resultados
+
+
 # Pruebas para la función de ancestro común más cercano
 def probar_ancestro_comun_mas_cercano():
     """Prueba la función ancestro_comun_mas_cercano."""
@@ -193,6 +746,55 @@ def probar_ancestro_comun_mas_cercano():
         print(f"Ancestro común más cercano de {p} y {q}: {lca5}")
     else:
         print(f"Al menos uno de los nodos ({p}, {q}) no está en el árbol.")
+    
+    # Caso de prueba 6: Índice para muchas consultas
+    print("\n--- Caso de prueba 6: Índice para muchas consultas ---")
+    # Usamos el árbol del caso 1
+    indice6 = IndiceAncestros(arbol1.raiz)
+    for p, q in [(4, 6), (4, 5), (5, 2), (6, 6), (4, 99)]:
+        print(f"Ancestro común más cercano de {p} y {q}: {indice6.lca(p, q)}")
+    
+    # Caso de prueba 7: Consultas en lote
+    print("\n--- Caso de prueba 7: Consultas en lote ---")
+    # Usamos el árbol del caso 1
+    pares7 = [(4, 6), (4, 5), (5, 2), (6, 6), (4, 99)]
+    print(f"Ancestros comunes más cercanos de {pares7}: {ancestro_comun_mas_cercano_lote(arbol1.raiz, pares7)}")
+    
+    # Caso de prueba 8: Ancestros k niveles arriba, profundidad y distancia
+    print("\n--- Caso de prueba 8: Ancestros k niveles arriba, profundidad y distancia ---")
+    # Usamos el árbol del caso 1
+    tabla8 = TablaAncestros(arbol1.raiz)
+    print(f"Ancestro 1 nivel arriba de 5: {tabla8.ancestro_k(5, 1)}")
+    print(f"Ancestro 2 niveles arriba de 6: {tabla8.ancestro_k(6, 2)}")
+    print(f"Ancestro 3 niveles arriba de 4: {tabla8.ancestro_k(4, 3)}")
+    print(f"Profundidad de 4: {tabla8.profundidad(4)}")
+    print(f"Distancia entre 4 y 6: {tabla8.distancia(4, 6)}")
+    print(f"Ancestro común más cercano de 4 y 5: {tabla8.lca(4, 5)}")
+    
+    # Caso de prueba 9: Árbol con índice de valores
+    print("\n--- Caso de prueba 9: Árbol con índice de valores ---")
+    arbol9 = ArbolBinario(indexar=True)
+    arbol9.construir_arbol_desde_lista([1, 2, 3, 4, 5, None, 6])
+    
+    print(f"¿Contiene 99? {arbol9.contiene(99)}")
+    print(f"Ancestro común más cercano de 4 y 6: {arbol9.ancestro_comun(4, 6)}")
+    print(f"Ancestro común más cercano de 4 y 99: {arbol9.ancestro_comun(4, 99)}")
+    
+    arbol9.agregar_hijo(arbol9.buscar(5), 7)
+    arbol9.eliminar_subarbol(arbol9.buscar(4))
+    print("Árbol tras agregar 7 bajo 5 y eliminar 4:")
+    arbol9.imprimir_estructura()
+    print(f"¿Contiene 4? {arbol9.contiene(4)}")
+    print(f"Ancestro común más cercano de 7 y 2: {arbol9.ancestro_comun(7, 2)}")
+    print(f"Con el árbol en lugar de la raíz: {ancestro_comun_mas_cercano(arbol9, 7, 3)}")
+    
+    # Con valores repetidos se usa el primer nodo en orden de nivel, con o sin índice
+    sin_indice = ArbolBinario()
+    sin_indice.construir_arbol_desde_lista([1, 2, 3, None, 5, None, 6, 7])
+    for arbol in (arbol9, sin_indice):
+        arbol.agregar_hijo(arbol.buscar(3), 7)
+    print(f"Ancestro común de 6 y 7 tras agregar otro 7 bajo 3: {arbol9.ancestro_comun(6, 7)} "
+          f"(sin índice: {sin_indice.ancestro_comun(6, 7)})")
         
 # Ejecutar las pruebas
 if __name__ == "__main__":
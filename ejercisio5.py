@@ -9,8 +9,15 @@ class NodoArbol:
 
 class ArbolBinario:
     """Clase para representar un árbol binario."""
-    def __init__(self):
+    def __init__(self, indexar=False):
+        """
+        Args:
+            indexar: Si es True, mantiene un índice de valor a nodos con el que
+                contiene no recorre el árbol. El índice solo se actualiza con
+                los métodos de la clase, no al modificar los nodos directamente.
+        """
         self.raiz = None
+        self._nodos_por_valor = {} if indexar else None
     
     def construir_arbol_desde_lista(self, lista):
         """Construye un árbol binario a partir de una lista de valores en orden de nivel."""
@@ -35,6 +42,46 @@ class ArbolBinario:
                 nodo_actual.derecha = NodoArbol(lista[i])
                 cola.append(nodo_actual.derecha)
             i += 1
+        
+        if self._nodos_por_valor is not None:
+            self._indexar()
+    
+    def _indexar(self):
+        """Reconstruye el índice recorriendo el árbol por niveles."""
+        self._nodos_por_valor.clear()
+        
+        cola = deque([self.raiz] if self.raiz else [])
+        while cola:
+            nodo = cola.popleft()
+            self._nodos_por_valor.setdefault(nodo.valor, []).append(nodo)
+            if nodo.izquierda:
+                cola.append(nodo.izquierda)
+            if nodo.derecha:
+                cola.append(nodo.derecha)
+    
+    def contiene(self, valor):
+        """Indica si algún nodo tiene el valor dado (O(1) con índice)."""
+        if self._nodos_por_valor is not None:
+            return valor in self._nodos_por_valor
+        return contiene_valor(self.raiz, valor)
+    
+    def podar(self, objetivo):
+        """
+        Poda el árbol con podar_arbol y actualiza el índice.
+        
+        Args:
+            objetivo: El valor objetivo que deben contener los subárboles que se conservan.
+        """
+        if self._nodos_por_valor is None:
+            self.raiz = podar_arbol(self.raiz, objetivo)
+            return
+        
+        # Sin el objetivo en el índice, la poda elimina todo el árbol
+        if objetivo not in self._nodos_por_valor:
+            self.raiz = None
+        else:
+            self.raiz = podar_arbol(self.raiz, objetivo)
+        self._indexar()
     
     def imprimir_estructura(self):
         """Imprime la estructura del árbol en forma visual."""
@@ -199,6 +246,18 @@ def probar_podar_arbol():
     
     print("Árbol podado (para valor 5):")
     arbol_podado5.imprimir_estructura()
+    
+    # Caso de prueba 6: Árbol con índice de valores
+    print("\n--- Caso de prueba 6: Árbol con índice de valores ---")
+    arbol6 = ArbolBinario(indexar=True)
+    arbol6.construir_arbol_desde_lista([1, 2, 3, 4, 5, None, 6])
+    
+    print(f"¿Contiene 5? {arbol6.contiene(5)}")
+    arbol6.podar(6)
+    
+    print("Árbol podado (para valor 6):")
+    arbol6.imprimir_estructura()
+    print(f"¿Contiene 5? {arbol6.contiene(5)}")
 
 # Ejecutar las pruebas
 if __name__ == "__main__":